@@ -5,7 +5,7 @@ import hashlib
 import json
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 def utc_now_iso() -> str:
@@ -25,6 +25,9 @@ class Cache:
         self.conn.row_factory = sqlite3.Row
         self._pending_writes = 0
         self._commit_every = max(1, int(commit_every))
+        # Search responses are staged here and written with one executemany per commit.
+        self._pending_search_rows: Dict[str, Tuple[str, str]] = {}
+        self._pending_routes_rows: Dict[str, Tuple[str, str, str, Optional[int], str]] = {}
         self._configure_conn()
         self._init_db()
 
@@ -87,6 +90,27 @@ class Cache:
             self.commit()
 
     def commit(self) -> None:
+        if self._pending_search_rows:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO places_search_cache (key, response_json, created_at)
+                VALUES (?, ?, ?)
+                """,
+                [
+                    (key, response_json, created_at)
+                    for key, (response_json, created_at) in self._pending_search_rows.items()
+                ],
+            )
+            self._pending_search_rows.clear()
+        if self._pending_routes_rows:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO routes_cache (key, origin_id, place_id, mode, duration_seconds, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [(key, *row) for key, row in self._pending_routes_rows.items()],
+            )
+            self._pending_routes_rows.clear()
         if self._pending_writes:
             self.conn.commit()
             self._pending_writes = 0
@@ -102,6 +126,9 @@ class Cache:
             pass
 
     def get_search_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        pending = self._pending_search_rows.get(key)
+        if pending is not None:
+            return json.loads(pending[0])
         cur = self.conn.cursor()
         cur.execute("SELECT response_json FROM places_search_cache WHERE key = ?", (key,))
         row = cur.fetchone()
@@ -110,16 +137,15 @@ class Cache:
         return json.loads(row["response_json"])
 
     def set_search_cache(self, key: str, response: Dict[str, Any]) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT OR REPLACE INTO places_search_cache (key, response_json, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (key, json.dumps(response), utc_now_iso()),
-        )
+        self._pending_search_rows[key] = (json.dumps(response), utc_now_iso())
         self._mark_dirty()
 
+    def set_search_cache_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        created_at = utc_now_iso()
+        for key, response in items:
+            self._pending_search_rows[key] = (json.dumps(response), created_at)
+            self._mark_dirty()
+
     def upsert_place(self, place: Dict[str, Any]) -> None:
         cur = self.conn.cursor()
         cur.execute(
@@ -172,6 +198,9 @@ class Cache:
             }
 
     def get_routes_cache(self, key: str) -> Optional[int]:
+        pending = self._pending_routes_rows.get(key)
+        if pending is not None:
+            return pending[3]
         cur = self.conn.cursor()
         cur.execute("SELECT duration_seconds FROM routes_cache WHERE key = ?", (key,))
         row = cur.fetchone()
@@ -182,12 +211,14 @@ class Cache:
     def set_routes_cache(
         self, key: str, origin_id: str, place_id: str, mode: str, duration_seconds: Optional[int]
     ) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT OR REPLACE INTO routes_cache (key, origin_id, place_id, mode, duration_seconds, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (key, origin_id, place_id, mode, duration_seconds, utc_now_iso()),
-        )
+        self._pending_routes_rows[key] = (origin_id, place_id, mode, duration_seconds, utc_now_iso())
         self._mark_dirty()
+
+    def set_routes_cache_many(
+        self, rows: List[Tuple[str, str, str, str, Optional[int]]]
+    ) -> None:
+        # (key, origin_id, place_id, mode, duration_seconds) rows, staged together.
+        created_at = utc_now_iso()
+        for key, origin_id, place_id, mode, duration_seconds in rows:
+            self._pending_routes_rows[key] = (origin_id, place_id, mode, duration_seconds, created_at)
+            self._mark_dirty()
@@ -18,6 +18,7 @@ _REPO_ROOT = Path(__file__).resolve().parent.parent
 PLACES_TEXT_SEARCH_URL = "https://places.googleapis.com/v1/places:searchText"
 PLACES_NEARBY_SEARCH_URL = "https://places.googleapis.com/v1/places:searchNearby"
 ROUTES_COMPUTE_URL = "https://routes.googleapis.com/directions/v2:computeRoutes"
+ROUTES_MATRIX_URL = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix"
 
 # --- Field masks ---
 
@@ -27,6 +28,7 @@ PLACES_FIELD_MASK_MIN = (
 )
 ROUTES_FIELD_MASK_MIN = "routes.duration"
 ROUTES_FIELD_MASK_DEBUG = "routes.duration,routes.distanceMeters"
+ROUTES_MATRIX_FIELD_MASK_MIN = "originIndex,destinationIndex,duration,condition"
 
 # --- Defaults (used when no search_config.json) ---
 
@@ -119,7 +121,12 @@ DEPARTURE_POLICY = "next_weekday_17_00"
 WARSAW_TIMEZONE = "Europe/Warsaw"
 DEPARTURE_TIME_RFC3339_OVERRIDE: Optional[str] = None
 ROUTES_BODY_EXTRA: Dict[str, Any] = {}
+ROUTES_MATRIX_BODY_EXTRA: Dict[str, Any] = {}
 ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES = 15
+# Resolve each hub through computeRouteMatrix instead of one computeRoutes call per place.
+ROUTES_USE_MATRIX = False
+# Destinations per computeRouteMatrix call (one origin); TRANSIT allows 100 elements.
+ROUTES_MATRIX_MAX_DESTINATIONS = 25
 
 # --- Filters ---
 
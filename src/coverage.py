@@ -40,7 +40,16 @@ def pairwise_jaccard(sets_by_key: Dict[str, Set[str]]) -> Dict[str, float]:
 
 
 def build_grid(bbox: Dict[str, float], size: int) -> List[Dict[str, float]]:
-    return grid_points(bbox, size)
+    # A degenerate bbox yields coincident points that would issue identical searches.
+    seen: Set[Tuple[float, float]] = set()
+    points: List[Dict[str, float]] = []
+    for point in grid_points(bbox, size):
+        cell = (point["lat"], point["lon"])
+        if cell in seen:
+            continue
+        seen.add(cell)
+        points.append(point)
+    return points
 
 
 def flatten_place_ids(sets: Iterable[Set[str]]) -> Set[str]:
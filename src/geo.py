@@ -2,21 +2,54 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
-def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+def haversine_km(
+    lat1: float, lon1: float, lat2: float, lon2: float, cos_lat2: Optional[float] = None
+) -> float:
+    # cos_lat2 lets callers measuring many points to one fixed point pass
+    # cos(radians(lat2)) once; the result is unchanged.
     r = 6371.0
     phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
+    if cos_lat2 is None:
+        cos_lat2 = math.cos(math.radians(lat2))
     dphi = math.radians(lat2 - lat1)
     dlambda = math.radians(lon2 - lon1)
 
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * cos_lat2 * math.sin(dlambda / 2) ** 2
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return r * c
 
 
+# (id, lat, lon, cos(radians(lat))) per hub, reused across many places.
+PreparedHub = Tuple[Any, float, float, float]
+
+
+def prepare_hubs(hubs: Sequence[Dict[str, Any]]) -> List[PreparedHub]:
+    return [(h.get("id"), h["lat"], h["lon"], math.cos(math.radians(h["lat"]))) for h in hubs]
+
+
+def nearest_hub_km(
+    lat: float, lon: float, prepared: Sequence[PreparedHub]
+) -> Tuple[Optional[float], Optional[Any]]:
+    # Same arithmetic as haversine_km(lat, lon, hub_lat, hub_lon), with the
+    # hub-side cosine hoisted, so distances are bit-identical.
+    radians, sin, sqrt, atan2 = math.radians, math.sin, math.sqrt, math.atan2
+    cos_phi1 = math.cos(radians(lat))
+    nearest_id = None
+    min_dist: Optional[float] = None
+    for hub_id, hub_lat, hub_lon, cos_phi2 in prepared:
+        dphi = radians(hub_lat - lat)
+        dlambda = radians(hub_lon - lon)
+        a = sin(dphi / 2) ** 2 + cos_phi1 * cos_phi2 * sin(dlambda / 2) ** 2
+        dist = 6371.0 * (2 * atan2(sqrt(a), sqrt(1 - a)))
+        if min_dist is None or dist < min_dist:
+            min_dist = dist
+            nearest_id = hub_id
+    return min_dist, nearest_id
+
+
 def grid_points(bbox: Dict[str, float], n: int) -> List[Dict[str, float]]:
     if n <= 1:
         raise ValueError("Grid size must be > 1")
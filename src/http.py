@@ -6,7 +6,7 @@ import logging
 import random
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import requests
 
@@ -125,7 +125,13 @@ class HttpClient:
         self.retry_max = retry_max
         self.backoff_base = backoff_base
         self.backoff_max = backoff_max
+        # A single Session keeps the TLS connection to each Google host alive
+        # across calls; only the field mask varies per request.
         self.session = requests.Session()
+        self._base_headers = {
+            "X-Goog-Api-Key": api_key,
+            "Content-Type": "application/json",
+        }
 
     def post_json(
         self,
@@ -133,12 +139,9 @@ class HttpClient:
         body: Dict[str, Any],
         field_mask: str,
         extra_headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        headers = {
-            "X-Goog-Api-Key": self.api_key,
-            "X-Goog-FieldMask": field_mask,
-            "Content-Type": "application/json",
-        }
+    ) -> Union[Dict[str, Any], List[Any]]:
+        headers = dict(self._base_headers)
+        headers["X-Goog-FieldMask"] = field_mask
         if extra_headers:
             headers.update(extra_headers)
 
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import math
 import logging
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from . import config
 from .cache import Cache
@@ -14,10 +17,11 @@ from .coverage import (
     pairwise_jaccard,
     unique_contributions,
 )
-from .geo import haversine_km
+from .geo import PreparedHub, haversine_km, nearest_hub_km, prepare_hubs
 from .http import BudgetExceededError, HttpClient, RequestBudget, RequestMetrics
 from .places_client import PlacesClient
 from .reporting import (
+    BackgroundWriter,
     ProgressReporter,
     ensure_dir,
     write_rejections_csv,
@@ -31,7 +35,7 @@ from .reporting import (
     write_summary,
 )
 from .routes_client import RoutesClient, compute_departure_time_rfc3339
-from .scoring import quality_score
+from .scoring import quality_score_batch
 
 logger = logging.getLogger(__name__)
 
@@ -194,6 +198,8 @@ def run(
                 metrics=metrics,
             )
 
+    # One departure time per run, so the probe and transit scoring share a bucket.
+    departure_time: Optional[str] = None
     if dedup_probe:
         hub_id = sorted(config.HUBS.keys())[0]
         hub = config.HUBS[hub_id]
@@ -495,15 +501,22 @@ def run(
                 ensure_dir(center_output_dir)
                 logger.info("Stage 5: radius scan outputs (%s)", center_id)
                 progress.set_stage("outputs", total_estimate=3)
-                write_radius_scan_results_csv(
-                    f"{center_output_dir}/radius_scan_results.csv", all_rows_sorted
-                )
-                progress.advance()
-                write_results_json(f"{center_output_dir}/radius_scan_results.json", all_rows_sorted)
-                progress.advance()
-                summary_lines = render_radius_scan_summary(summary)
-                write_summary(f"{center_output_dir}/radius_scan_summary.txt", summary_lines)
-                progress.advance()
+                with BackgroundWriter() as writer:
+                    writer.submit(
+                        write_radius_scan_results_csv,
+                        f"{center_output_dir}/radius_scan_results.csv",
+                        all_rows_sorted,
+                    )
+                    writer.submit(
+                        write_results_json,
+                        f"{center_output_dir}/radius_scan_results.json",
+                        all_rows_sorted,
+                    )
+                    summary_lines = render_radius_scan_summary(summary)
+                    writer.submit(
+                        write_summary, f"{center_output_dir}/radius_scan_summary.txt", summary_lines
+                    )
+                progress.advance(3)
 
             return places_by_id_local, summary, all_rows_sorted
 
@@ -565,16 +578,18 @@ def run(
         rejection_counts: Dict[str, int] = {}
         eligible: List[Dict[str, Any]] = []
         for place in merged_places.values():
-            dist_map = place.get("distance_km_by_center") or {}
-            valid_dists = {k: v for k, v in dist_map.items() if v is not None}
-            if valid_dists:
-                nearest_center_id = min(valid_dists, key=lambda k: valid_dists[k])
-                min_dist = valid_dists[nearest_center_id]
-                centers_in_range = [k for k, v in valid_dists.items() if v <= radius_km]
-            else:
-                nearest_center_id = None
-                min_dist = None
-                centers_in_range = []
+            # Nearest center, its distance and the in-range list in one sweep.
+            nearest_center_id = None
+            min_dist = None
+            centers_in_range = []
+            for center_id, dist in (place.get("distance_km_by_center") or {}).items():
+                if dist is None:
+                    continue
+                if min_dist is None or dist < min_dist:
+                    nearest_center_id = center_id
+                    min_dist = dist
+                if dist <= radius_km:
+                    centers_in_range.append(center_id)
 
             place["nearest_center_id"] = nearest_center_id
             place["min_distance_km_to_any_center"] = min_dist
@@ -653,17 +668,22 @@ def run(
         if write_outputs:
             logger.info("Stage 5: radius scan merged outputs")
             progress.set_stage("outputs", total_estimate=3)
-            write_radius_scan_merged_results_csv(
-                f"{output_dir}/radius_scan_merged_results.csv", all_rows_sorted
-            )
-            progress.advance()
-            write_results_json(
-                f"{output_dir}/radius_scan_merged_results.json", all_rows_sorted
-            )
-            progress.advance()
-            summary_lines = render_radius_scan_merged_summary(merged_summary)
-            write_summary(f"{output_dir}/radius_scan_merged_summary.txt", summary_lines)
-            progress.advance()
+            with BackgroundWriter() as writer:
+                writer.submit(
+                    write_radius_scan_merged_results_csv,
+                    f"{output_dir}/radius_scan_merged_results.csv",
+                    all_rows_sorted,
+                )
+                writer.submit(
+                    write_results_json,
+                    f"{output_dir}/radius_scan_merged_results.json",
+                    all_rows_sorted,
+                )
+                summary_lines = render_radius_scan_merged_summary(merged_summary)
+                writer.submit(
+                    write_summary, f"{output_dir}/radius_scan_merged_summary.txt", summary_lines
+                )
+            progress.advance(3)
 
         progress.flush()
         cache.close()
@@ -924,13 +944,16 @@ def run(
         if write_outputs:
             logger.info("Stage 5: list-mode outputs")
             progress.set_stage("outputs", total_estimate=3)
-            write_list_mode_results_csv(f"{output_dir}/list_mode_results.csv", all_rows_sorted)
-            progress.advance()
-            write_results_json(f"{output_dir}/list_mode_results.json", all_rows_sorted)
-            progress.advance()
-            summary_lines = render_list_mode_summary(summary)
-            write_summary(f"{output_dir}/list_mode_summary.txt", summary_lines)
-            progress.advance()
+            with BackgroundWriter() as writer:
+                writer.submit(
+                    write_list_mode_results_csv, f"{output_dir}/list_mode_results.csv", all_rows_sorted
+                )
+                writer.submit(
+                    write_results_json, f"{output_dir}/list_mode_results.json", all_rows_sorted
+                )
+                summary_lines = render_list_mode_summary(summary)
+                writer.submit(write_summary, f"{output_dir}/list_mode_summary.txt", summary_lines)
+            progress.advance(3)
 
         progress.flush()
         cache.close()
@@ -953,21 +976,21 @@ def run(
     if skip_routes:
         logger.info("Stage 4: transit skipped")
         progress.set_stage("transit", total_estimate=len(shortlist))
-        for place in shortlist:
+        for place, ortho_relevance in zip(shortlist, compute_ortho_relevance_all(shortlist)):
             place["transit_min_minutes"] = None
             place["transit_score"] = None
-            ortho_relevance = compute_ortho_relevance(place)
             place["ortho_relevance"] = ortho_relevance
-            place["final"] = compute_final_score(
-                place.get("quality", 0.0),
-                None,
-                ortho_relevance,
-            )
+        finals = compute_final_scores(
+            (place.get("quality", 0.0), None, place["ortho_relevance"]) for place in shortlist
+        )
+        for place, final in zip(shortlist, finals):
+            place["final"] = final
             progress.advance()
     else:
         logger.info("Stage 4: transit scoring")
         progress.set_stage("transit", total_estimate=len(shortlist))
-        departure_time = compute_departure_time_rfc3339()
+        if departure_time is None:
+            departure_time = compute_departure_time_rfc3339()
         apply_transit(
             shortlist,
             hubs,
@@ -1040,19 +1063,15 @@ def run(
     if write_outputs:
         logger.info("Stage 5: outputs")
         progress.set_stage("outputs", total_estimate=6)
-        write_results_csv(f"{output_dir}/results.csv", all_rows_sorted)
-        progress.advance()
-        write_results_json(f"{output_dir}/results.json", all_rows_sorted)
-        progress.advance()
-        summary_lines = render_summary(summary)
-        write_summary(f"{output_dir}/summary.txt", summary_lines)
-        progress.advance()
-        write_json_object(f"{output_dir}/coverage.json", coverage_report)
-        progress.advance()
-        write_rejections_csv(f"{output_dir}/rejections.csv", rejections_sorted)
-        progress.advance()
-        write_rejections_jsonl(f"{output_dir}/rejections.jsonl", rejections_sorted)
-        progress.advance()
+        with BackgroundWriter() as writer:
+            writer.submit(write_results_csv, f"{output_dir}/results.csv", all_rows_sorted)
+            writer.submit(write_results_json, f"{output_dir}/results.json", all_rows_sorted)
+            summary_lines = render_summary(summary)
+            writer.submit(write_summary, f"{output_dir}/summary.txt", summary_lines)
+            writer.submit(write_json_object, f"{output_dir}/coverage.json", coverage_report)
+            writer.submit(write_rejections_csv, f"{output_dir}/rejections.csv", rejections_sorted)
+            writer.submit(write_rejections_jsonl, f"{output_dir}/rejections.jsonl", rejections_sorted)
+        progress.advance(6)
 
     progress.flush()
     cache.close()
@@ -1149,30 +1168,30 @@ def quality_sort_key_full(row: Dict[str, Any]) -> Tuple[float, int, float, str,
 
 
 def compute_min_distance_km_to_any_hub(
-    place: Dict[str, Any], hubs: List[Dict[str, Any]]
+    place: Dict[str, Any],
+    hubs: List[Dict[str, Any]],
+    prepared_hubs: Optional[List[PreparedHub]] = None,
 ) -> Tuple[Optional[float], Optional[str]]:
     lat = place.get("lat")
     lon = place.get("lon")
     if lat is None or lon is None or not hubs:
         return None, None
-    nearest_id: Optional[str] = None
-    min_dist: Optional[float] = None
-    for hub in hubs:
-        dist = haversine_km(lat, lon, hub["lat"], hub["lon"])
-        if min_dist is None or dist < min_dist:
-            min_dist = dist
-            nearest_id = hub["id"]
-    return min_dist, nearest_id
+    if prepared_hubs is None:
+        prepared_hubs = prepare_hubs(hubs)
+    return nearest_hub_km(lat, lon, prepared_hubs)
 
 
 def compute_distance_km_to_center(
-    place: Dict[str, Any], center_lat: float, center_lon: float
+    place: Dict[str, Any],
+    center_lat: float,
+    center_lon: float,
+    cos_center_lat: Optional[float] = None,
 ) -> Optional[float]:
     lat = place.get("lat")
     lon = place.get("lon")
     if lat is None or lon is None:
         return None
-    return haversine_km(lat, lon, center_lat, center_lon)
+    return haversine_km(lat, lon, center_lat, center_lon, cos_center_lat)
 
 
 def build_radius_scan_points(
@@ -1200,17 +1219,40 @@ def build_radius_scan_points(
     lat_delta = radius_km / 111.0
     lon_delta = radius_km / (111.0 * cos_center)
 
+    epsilon = 1e-6
+    # Every row walks the same longitudes, so the longitude half of the
+    # haversine formula is computed once per column and the latitude half
+    # once per row. Same arithmetic as haversine_km, so distances are bit-identical.
+    radians, sin, sqrt, atan2 = math.radians, math.sin, math.sqrt, math.atan2
+    columns: List[Tuple[float, float]] = []
+    lon = center_lon - lon_delta
+    while lon <= center_lon + lon_delta + epsilon:
+        columns.append((lon, sin(radians(center_lon - lon) / 2) ** 2))
+        lon += lon_step
+
+    cos_center_phi = math.cos(radians(center_lat))
+    limit_km = radius_km + 1e-6
+    # The distance grows monotonically with the haversine term ``a``, so
+    # points clearly inside or outside the radius are decided by comparing
+    # ``a`` with its value at the radius. Only points in a thin band around
+    # the boundary pay for the exact atan2/sqrt distance.
+    half_angle = limit_km / 6371.0 / 2
+    if half_angle < math.pi / 2:
+        a_limit = sin(half_angle) ** 2
+        a_inside, a_outside = a_limit * (1 - 1e-9), a_limit * (1 + 1e-9)
+    else:
+        a_inside, a_outside = -1.0, 2.0
     points: List[Dict[str, Any]] = []
-    idx = 0
     lat = center_lat - lat_delta
-    epsilon = 1e-6
     while lat <= center_lat + lat_delta + epsilon:
-        lon = center_lon - lon_delta
-        while lon <= center_lon + lon_delta + epsilon:
-            if haversine_km(lat, lon, center_lat, center_lon) <= radius_km + 1e-6:
-                points.append({"id": f"scan_{idx}", "lat": lat, "lon": lon})
-                idx += 1
-            lon += lon_step
+        sin_dphi_sq = sin(radians(center_lat - lat) / 2) ** 2
+        cos_product = math.cos(radians(lat)) * cos_center_phi
+        for lon, sin_dlambda_sq in columns:
+            a = sin_dphi_sq + cos_product * sin_dlambda_sq
+            if a > a_outside:
+                continue
+            if a < a_inside or 6371.0 * (2 * atan2(sqrt(a), sqrt(1 - a))) <= limit_km:
+                points.append({"id": f"scan_{len(points)}", "lat": lat, "lon": lon})
         lat += lat_step
     return points
 
@@ -1224,8 +1266,9 @@ def apply_radius_scan_filters(
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     filtered = []
     rejection_counts: Dict[str, int] = {}
+    cos_center_lat = math.cos(math.radians(center_lat))
     for place in places_by_id.values():
-        dist_km = compute_distance_km_to_center(place, center_lat, center_lon)
+        dist_km = compute_distance_km_to_center(place, center_lat, center_lon, cos_center_lat)
         place["distance_km_to_center"] = dist_km
 
         reason = None
@@ -1309,9 +1352,10 @@ def apply_list_mode_filters(
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     filtered = []
     rejection_counts: Dict[str, int] = {}
+    prepared_hubs = prepare_hubs(hubs)
 
     for place in places_by_id.values():
-        min_dist, nearest_id = compute_min_distance_km_to_any_hub(place, hubs)
+        min_dist, nearest_id = compute_min_distance_km_to_any_hub(place, hubs, prepared_hubs)
         place["min_distance_km_to_any_hub"] = min_dist
         place["nearest_hub_id"] = nearest_id
 
@@ -1354,9 +1398,13 @@ def compute_quality_all(
     if not places:
         return []
     c = sum(p["rating"] for p in places if p.get("rating") is not None) / len(places)
-    for place in places:
-        v = int(place["user_rating_count"])
-        scores = quality_score(float(place["rating"]), v, c, config.BAYES_M)
+    all_scores = quality_score_batch(
+        [float(place["rating"]) for place in places],
+        [int(place["user_rating_count"]) for place in places],
+        c,
+        config.BAYES_M,
+    )
+    for place, scores in zip(places, all_scores):
         place.update(scores)
         if progress_reporter:
             progress_reporter.advance()
@@ -1391,8 +1439,11 @@ def apply_filters(
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     filtered = []
     rejection_counts: Dict[str, int] = {}
+    places = list(places_by_id.values())
+    domain_rejected = domain_reject_mask([place.get("name") for place in places])
+    prepared_hubs = prepare_hubs(hubs)
 
-    for place in places_by_id.values():
+    for place, is_domain_rejected in zip(places, domain_rejected):
         reason = None
 
         if place.get("rating") is None:
@@ -1404,9 +1455,7 @@ def apply_filters(
         elif place.get("lat") is None or place.get("lon") is None:
             reason = "missing_location"
         else:
-            dist_km = min(
-                haversine_km(place["lat"], place["lon"], h["lat"], h["lon"]) for h in hubs
-            )
+            dist_km, _ = nearest_hub_km(place["lat"], place["lon"], prepared_hubs)
             place["distance_km"] = dist_km
             if dist_km > config.MAX_DISTANCE_KM:
                 reason = "too_far"
@@ -1422,12 +1471,8 @@ def apply_filters(
                 if types.intersection(config.NON_MEDICAL_TYPES):
                     reason = "non_medical_types"
 
-        if reason is None:
-            name_casefold = (place.get("name") or "").casefold()
-            for banned in config.DOMAIN_REJECT_NAME_SUBSTRINGS:
-                if banned and banned.casefold() in name_casefold:
-                    reason = "irrelevant_domain"
-                    break
+        if reason is None and is_domain_rejected:
+            reason = "irrelevant_domain"
 
         if reason:
             place["rejected_reason"] = reason
@@ -1441,6 +1486,24 @@ def apply_filters(
     return filtered, rejection_counts
 
 
+@lru_cache(maxsize=8)
+def _domain_reject_pattern(substrings: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    # One alternation of all banned substrings; keyed on the config tuple so a
+    # changed DOMAIN_REJECT_NAME_SUBSTRINGS compiles a fresh pattern.
+    needles = sorted({s.casefold() for s in substrings if s}, key=len, reverse=True)
+    if not needles:
+        return None
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+def domain_reject_mask(names: Sequence[Optional[str]]) -> List[bool]:
+    pattern = _domain_reject_pattern(tuple(config.DOMAIN_REJECT_NAME_SUBSTRINGS))
+    if pattern is None:
+        return [False] * len(names)
+    search = pattern.search
+    return [search((name or "").casefold()) is not None for name in names]
+
+
 def compute_quality(
     places: List[Dict[str, Any]],
     top_n: int,
@@ -1449,9 +1512,13 @@ def compute_quality(
     if not places:
         return []
     c = sum(p["rating"] for p in places if p.get("rating") is not None) / len(places)
-    for place in places:
-        v = int(place["user_rating_count"])
-        scores = quality_score(float(place["rating"]), v, c, config.BAYES_M)
+    all_scores = quality_score_batch(
+        [float(place["rating"]) for place in places],
+        [int(place["user_rating_count"]) for place in places],
+        c,
+        config.BAYES_M,
+    )
+    for place, scores in zip(places, all_scores):
         place.update(scores)
         if progress_reporter:
             progress_reporter.advance()
@@ -1477,12 +1544,25 @@ def apply_transit(
     rejection_counts: Dict[str, int],
     progress_reporter: Optional[ProgressReporter] = None,
 ) -> List[Dict[str, Any]]:
+    durations_by_hub: Optional[Dict[str, Dict[str, Optional[int]]]] = None
+    if config.ROUTES_USE_MATRIX:
+        durations_by_hub = {
+            hub["id"]: routes_client.compute_route_durations_batch(
+                hub["id"], hub, shortlist, departure_time, mode=config.TRANSIT_MODE
+            )
+            for hub in hubs
+        }
+
+    relevance_scorer = _OrthoRelevanceScorer()
     for place in shortlist:
         durations = []
         for hub in hubs:
-            duration = routes_client.compute_route_duration(
-                hub["id"], hub, place, departure_time, mode=config.TRANSIT_MODE
-            )
+            if durations_by_hub is not None:
+                duration = durations_by_hub[hub["id"]].get(place["place_id"])
+            else:
+                duration = routes_client.compute_route_duration(
+                    hub["id"], hub, place, departure_time, mode=config.TRANSIT_MODE
+                )
             if duration is not None:
                 durations.append(duration)
         if not durations:
@@ -1507,7 +1587,7 @@ def apply_transit(
 
         transit_score = 100.0 * math.exp(-min_minutes / config.TRANSIT_SCORE_K)
         place["transit_score"] = transit_score
-        ortho_relevance = compute_ortho_relevance(place)
+        ortho_relevance = relevance_scorer.score(place)
         place["ortho_relevance"] = ortho_relevance
         place["final"] = compute_final_score(
             place.get("quality", 0.0),
@@ -1546,11 +1626,16 @@ def coverage_check(
         return coverage_budget.remaining(budget)
 
     # Compute U_hubs from existing hub harvest
-    hub_ids = {h["id"] for h in hubs}
-    u_hubs: Set[str] = set()
-    for query in coverage_queries:
-        for hub_id in hub_ids:
-            u_hubs.update(results_by_query_point.get((query, hub_id), set()))
+    # Walk the populated (query, point) keys instead of the queries x hubs product.
+    coverage_query_set = frozenset(coverage_queries)
+    hub_ids = frozenset(h["id"] for h in hubs)
+    u_hubs: Set[str] = set(
+        chain.from_iterable(
+            place_ids
+            for (query, point_id), place_ids in results_by_query_point.items()
+            if query in coverage_query_set and point_id in hub_ids
+        )
+    )
 
     grid_size = grid_size_initial
     max_iter = grid_max_iterations
@@ -1644,18 +1729,14 @@ def render_summary(summary: Dict[str, Any]) -> List[str]:
     if "dedup_skips_places" in summary or "dedup_skips_routes" in summary:
         lines.append("Request stats:")
         lines.append(
-            "  Places: network={network}, cache_hits={cache_hits}, dedup_skips={dedup_skips}".format(
-                network=summary.get("places_requests", 0),
-                cache_hits=summary.get("cache_hits_places", 0),
-                dedup_skips=summary.get("dedup_skips_places", 0),
-            )
+            f"  Places: network={summary.get('places_requests', 0)}, "
+            f"cache_hits={summary.get('cache_hits_places', 0)}, "
+            f"dedup_skips={summary.get('dedup_skips_places', 0)}"
         )
         lines.append(
-            "  Routes: network={network}, cache_hits={cache_hits}, dedup_skips={dedup_skips}".format(
-                network=summary.get("routes_requests", 0),
-                cache_hits=summary.get("cache_hits_routes", 0),
-                dedup_skips=summary.get("dedup_skips_routes", 0),
-            )
+            f"  Routes: network={summary.get('routes_requests', 0)}, "
+            f"cache_hits={summary.get('cache_hits_routes', 0)}, "
+            f"dedup_skips={summary.get('dedup_skips_routes', 0)}"
         )
     if summary.get("routes_skipped"):
         lines.append("Routes stage: skipped")
@@ -1664,18 +1745,14 @@ def render_summary(summary: Dict[str, Any]) -> List[str]:
         lines.append("Coverage: DISABLED")
     else:
         lines.append(
-            "Coverage: U_hubs={u_hubs}, U_grid_total={u_grid_total}, uplift={uplift:.2%}".format(
-                u_hubs=cov.get("u_hubs", 0),
-                u_grid_total=cov.get("u_grid_total", 0),
-                uplift=cov.get("uplift", 0.0),
-            )
+            f"Coverage: U_hubs={cov.get('u_hubs', 0)}, "
+            f"U_grid_total={cov.get('u_grid_total', 0)}, "
+            f"uplift={cov.get('uplift', 0.0):.2%}"
         )
         lines.append(
-            "Coverage detail: U_grid_new={u_grid_new}, U_union_total={u_union_total}, grid_size={grid_size}".format(
-                u_grid_new=cov.get("u_grid_new", 0),
-                u_union_total=cov.get("u_union_total", 0),
-                grid_size=cov.get("grid_size", 0),
-            )
+            f"Coverage detail: U_grid_new={cov.get('u_grid_new', 0)}, "
+            f"U_union_total={cov.get('u_union_total', 0)}, "
+            f"grid_size={cov.get('grid_size', 0)}"
         )
     group_totals = summary.get("query_group_totals", {})
     if group_totals:
@@ -1684,31 +1761,21 @@ def render_summary(summary: Dict[str, Any]) -> List[str]:
         general_total = group_totals.get("general", 0)
         ortho_unique = group_uniques.get("ortho", 0)
         general_unique = group_uniques.get("general", 0)
-        lines.append(
-            "Query groups: ortho_total={ortho_total}, general_total={general_total}".format(
-                ortho_total=ortho_total,
-                general_total=general_total,
-            )
-        )
-        lines.append(
-            "Query group uniques: ortho={ortho_unique}, general={general_unique}".format(
-                ortho_unique=ortho_unique,
-                general_unique=general_unique,
-            )
-        )
+        lines.append(f"Query groups: ortho_total={ortho_total}, general_total={general_total}")
+        lines.append(f"Query group uniques: ortho={ortho_unique}, general={general_unique}")
     lines.append("Rejections:")
     for reason, count in sorted(summary.get("rejection_counts", {}).items()):
         lines.append(f"  - {reason}: {count}")
     lines.append("Top 10:")
     for item in summary.get("top10", []):
+        name = item.get("name") or ""
+        place_id = item.get("place_id") or ""
+        quality = item.get("quality") or 0.0
+        transit_min_minutes = item.get("transit_min_minutes") or 0.0
+        final = item.get("final") or 0.0
         lines.append(
-            "  - {name} ({place_id}) quality={quality:.1f} transit={transit_min_minutes:.1f} final={final:.1f}".format(
-                name=item.get("name") or "",
-                place_id=item.get("place_id") or "",
-                quality=item.get("quality") or 0.0,
-                transit_min_minutes=item.get("transit_min_minutes") or 0.0,
-                final=item.get("final") or 0.0,
-            )
+            f"  - {name} ({place_id}) quality={quality:.1f} "
+            f"transit={transit_min_minutes:.1f} final={final:.1f}"
         )
     return lines
 
@@ -1726,13 +1793,10 @@ def render_list_mode_summary(summary: Dict[str, Any]) -> List[str]:
         lines.append(f"  - {reason}: {count}")
     lines.append("Top 20 by quality:")
     for item in summary.get("top20", []):
-        lines.append(
-            "  - {name} ({place_id}) quality={quality:.1f}".format(
-                name=item.get("name") or "",
-                place_id=item.get("place_id") or "",
-                quality=item.get("quality") or 0.0,
-            )
-        )
+        name = item.get("name") or ""
+        place_id = item.get("place_id") or ""
+        quality = item.get("quality") or 0.0
+        lines.append(f"  - {name} ({place_id}) quality={quality:.1f}")
     return lines
 
 
@@ -1743,24 +1807,19 @@ def render_radius_scan_summary(summary: Dict[str, Any]) -> List[str]:
     lines.append(f"Rejected: {summary.get('rejected', 0)}")
     lines.append(f"Budget exceeded: {summary.get('budget_exceeded', False)}")
     lines.append(
-        "Request stats: places_network={places_network}, cache_hits={cache_hits}, dedup_skips={dedup_skips}".format(
-            places_network=summary.get("places_requests", 0),
-            cache_hits=summary.get("cache_hits_places", 0),
-            dedup_skips=summary.get("dedup_skips_places", 0),
-        )
+        f"Request stats: places_network={summary.get('places_requests', 0)}, "
+        f"cache_hits={summary.get('cache_hits_places', 0)}, "
+        f"dedup_skips={summary.get('dedup_skips_places', 0)}"
     )
     lines.append("Rejections:")
     for reason, count in sorted(summary.get("rejection_counts", {}).items()):
         lines.append(f"  - {reason}: {count}")
     lines.append("Top 20 by quality:")
     for item in summary.get("top20", []):
-        lines.append(
-            "  - {name} ({place_id}) quality={quality:.1f}".format(
-                name=item.get("name") or "",
-                place_id=item.get("place_id") or "",
-                quality=item.get("quality") or 0.0,
-            )
-        )
+        name = item.get("name") or ""
+        place_id = item.get("place_id") or ""
+        quality = item.get("quality") or 0.0
+        lines.append(f"  - {name} ({place_id}) quality={quality:.1f}")
     return lines
 
 
@@ -1771,31 +1830,35 @@ def render_radius_scan_merged_summary(summary: Dict[str, Any]) -> List[str]:
     lines.append(f"Rejected: {summary.get('rejected_count', 0)}")
     lines.append(f"Budget exceeded: {summary.get('budget_exceeded', False)}")
     lines.append(
-        "Request stats: places_network={places_network}, cache_hits={cache_hits}, dedup_skips={dedup_skips}".format(
-            places_network=summary.get("places_requests", 0),
-            cache_hits=summary.get("cache_hits_places", 0),
-            dedup_skips=summary.get("dedup_skips_places", 0),
-        )
+        f"Request stats: places_network={summary.get('places_requests', 0)}, "
+        f"cache_hits={summary.get('cache_hits_places', 0)}, "
+        f"dedup_skips={summary.get('dedup_skips_places', 0)}"
     )
+    per_center_counts = summary.get("per_center_unique_counts", {})
+    per_center_budget = summary.get("per_center_budget_exceeded", {})
+    # Both maps are keyed by the same centers; sort the ids once and share them.
+    center_ids = sorted(per_center_counts.keys() | per_center_budget.keys())
     lines.append("Per-center unique counts:")
-    for center_id, count in sorted(summary.get("per_center_unique_counts", {}).items()):
-        lines.append(f"  - {center_id}: {count}")
+    for center_id in center_ids:
+        if center_id in per_center_counts:
+            lines.append(f"  - {center_id}: {per_center_counts[center_id]}")
     lines.append("Per-center budget exceeded:")
-    for center_id, flag in sorted(summary.get("per_center_budget_exceeded", {}).items()):
-        lines.append(f"  - {center_id}: {flag}")
+    for center_id in center_ids:
+        if center_id in per_center_budget:
+            lines.append(f"  - {center_id}: {per_center_budget[center_id]}")
     lines.append("Rejections:")
     for reason, count in sorted(summary.get("rejection_counts", {}).items()):
         lines.append(f"  - {reason}: {count}")
     lines.append("Top 50 preview:")
     for item in summary.get("top50", []):
+        name = item.get("name") or ""
+        place_id = item.get("place_id") or ""
+        quality = item.get("quality") or 0.0
+        min_dist = item.get("min_distance_km_to_any_center") or 0.0
+        nearest = item.get("nearest_center_id") or ""
         lines.append(
-            "  - {name} ({place_id}) quality={quality:.1f} min_dist={min_dist:.2f} nearest={nearest}".format(
-                name=item.get("name") or "",
-                place_id=item.get("place_id") or "",
-                quality=item.get("quality") or 0.0,
-                min_dist=item.get("min_distance_km_to_any_center") or 0.0,
-                nearest=item.get("nearest_center_id") or "",
-            )
+            f"  - {name} ({place_id}) quality={quality:.1f} "
+            f"min_dist={min_dist:.2f} nearest={nearest}"
         )
     return lines
 
@@ -1823,41 +1886,77 @@ def _matches_any(text: str, needles: Iterable[str]) -> bool:
     return False
 
 
+class _OrthoRelevanceScorer:
+    # Snapshot of the relevance config plus a per-query memo, so scoring many
+    # places re-derives each distinct query's flags only once.
+    def __init__(self) -> None:
+        self.base = float(config.ORTHO_RELEVANCE_BASE)
+        self.query_bonus = float(config.ORTHO_RELEVANCE_QUERY_BONUS)
+        self.name_bonus = float(config.ORTHO_RELEVANCE_NAME_BONUS)
+        self.generic_penalty = float(config.ORTHO_RELEVANCE_GENERIC_PENALTY)
+        self.general_only_penalty = float(config.ORTHO_GENERAL_ONLY_PENALTY)
+        self.name_hints = list(config.ORTHO_NAME_HINTS)
+        self.query_hints = list(config.ORTHO_QUERY_HINTS)
+        self.generic_hints = list(config.ORTHO_GENERIC_QUERY_HINTS)
+        self.ortho_query_set = set(config.ORTHO_QUERIES)
+        self.general_query_set = set(config.GENERAL_QUERIES)
+        self._query_flags: Dict[str, Tuple[Optional[str], bool, bool]] = {}
+
+    def _flags(self, query_str: str) -> Tuple[Optional[str], bool, bool]:
+        flags = self._query_flags.get(query_str)
+        if flags is None:
+            if query_str in self.ortho_query_set:
+                group: Optional[str] = "ortho"
+            elif query_str in self.general_query_set:
+                group = "general"
+            else:
+                group = None
+            lowered = query_str.lower()
+            flags = (
+                group,
+                _matches_any(lowered, self.query_hints),
+                _matches_any(lowered, self.generic_hints),
+            )
+            self._query_flags[query_str] = flags
+        return flags
+
+    def score(self, place: Dict[str, Any]) -> float:
+        score = self.base
+        name = (place.get("name") or "").lower()
+        groups: Set[str] = set()
+        has_queries = False
+        has_ortho_query = False
+        all_generic = True
+        for item in place.get("found_by") or []:
+            group = item.get("group")
+            if isinstance(group, str) and group in {"ortho", "general"}:
+                groups.add(group)
+            query = item.get("query")
+            if query:
+                query_group, is_ortho_hint, is_generic = self._flags(str(query))
+                has_queries = True
+                if query_group is not None:
+                    groups.add(query_group)
+                has_ortho_query = has_ortho_query or is_ortho_hint
+                all_generic = all_generic and is_generic
+        if has_ortho_query:
+            score += self.query_bonus
+        if _matches_any(name, self.name_hints):
+            score += self.name_bonus
+        if has_queries and all_generic and not has_ortho_query:
+            score -= self.generic_penalty
+        if "general" in groups and "ortho" not in groups:
+            score -= self.general_only_penalty
+        return max(0.0, min(100.0, score))
+
+
 def compute_ortho_relevance(place: Dict[str, Any]) -> float:
-    score = float(config.ORTHO_RELEVANCE_BASE)
-    name = (place.get("name") or "").lower()
-    found_by = place.get("found_by") or []
-    queries: List[str] = []
-    groups: Set[str] = set()
-    ortho_query_set = set(config.ORTHO_QUERIES)
-    general_query_set = set(config.GENERAL_QUERIES)
-    for item in found_by:
-        group = item.get("group")
-        if isinstance(group, str) and group in {"ortho", "general"}:
-            groups.add(group)
-        query = item.get("query")
-        if query:
-            query_str = str(query)
-            queries.append(query_str)
-            if query_str in ortho_query_set:
-                groups.add("ortho")
-            elif query_str in general_query_set:
-                groups.add("general")
-    lower_queries = [q.lower() for q in queries]
-    has_ortho_query = any(_matches_any(q, config.ORTHO_QUERY_HINTS) for q in lower_queries)
-    if has_ortho_query:
-        score += float(config.ORTHO_RELEVANCE_QUERY_BONUS)
-    if _matches_any(name, config.ORTHO_NAME_HINTS):
-        score += float(config.ORTHO_RELEVANCE_NAME_BONUS)
-    if lower_queries:
-        all_generic = all(_matches_any(q, config.ORTHO_GENERIC_QUERY_HINTS) for q in lower_queries)
-        if all_generic and not has_ortho_query:
-            score -= float(config.ORTHO_RELEVANCE_GENERIC_PENALTY)
-    has_ortho_group = "ortho" in groups
-    has_general_group = "general" in groups
-    if has_general_group and not has_ortho_group:
-        score -= float(config.ORTHO_GENERAL_ONLY_PENALTY)
-    return max(0.0, min(100.0, score))
+    return _OrthoRelevanceScorer().score(place)
+
+
+def compute_ortho_relevance_all(places: Iterable[Dict[str, Any]]) -> List[float]:
+    scorer = _OrthoRelevanceScorer()
+    return [scorer.score(place) for place in places]
 
 
 def compute_final_score(
@@ -1870,3 +1969,18 @@ def compute_final_score(
         + float(config.SCORE_WEIGHT_TRANSIT) * safe_float(transit_score)
         + float(config.SCORE_WEIGHT_ORTHO) * safe_float(ortho_relevance)
     )
+
+
+def compute_final_scores(
+    components: Iterable[Tuple[float, Optional[float], float]],
+) -> List[float]:
+    """Batch form of compute_final_score for (quality, transit_score, ortho_relevance) rows."""
+    w_quality = float(config.SCORE_WEIGHT_QUALITY)
+    w_transit = float(config.SCORE_WEIGHT_TRANSIT)
+    w_ortho = float(config.SCORE_WEIGHT_ORTHO)
+    return [
+        w_quality * safe_float(quality)
+        + w_transit * safe_float(transit_score)
+        + w_ortho * safe_float(ortho_relevance)
+        for quality, transit_score, ortho_relevance in components
+    ]
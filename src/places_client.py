@@ -1,7 +1,7 @@
 """Places API client with caching and response parsing."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from . import config
 from .cache import Cache, make_request_cache_key
@@ -26,8 +26,34 @@ class PlacesClient:
         self.refresh_places = refresh_places
         self.field_mask = field_mask
         self.metrics = metrics
+        # Must stay exact: a false positive here would route an unseen request
+        # through the dedup branch and silently drop a real search.
         self._seen_cache_keys: set[str] = set()
         self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._body_key_cache: Dict[
+            Tuple[str, Any, Any, Optional[str], Optional[str], Optional[int]],
+            Tuple[Dict[str, Any], str],
+        ] = {}
+        self._parsed_cache: Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]] = {}
+
+    def _text_search_request(
+        self,
+        query: str,
+        point: Dict[str, Any],
+        type_filter: Optional[str],
+        page_token: Optional[str],
+        radius_m: Optional[int],
+    ) -> Tuple[Dict[str, Any], str]:
+        # Keyed on coordinates rather than point ids: grid ids are reused
+        # across grid sizes with different lat/lon.
+        memo_key = (query, point["lat"], point["lon"], type_filter, page_token, radius_m)
+        memo = self._body_key_cache.get(memo_key)
+        if memo is None:
+            body = build_text_search_body(query, point, type_filter, page_token, radius_m=radius_m)
+            key = make_request_cache_key(config.PLACES_TEXT_SEARCH_URL, self.field_mask, body)
+            memo = (body, key)
+            self._body_key_cache[memo_key] = memo
+        return memo
 
     def search_text(
         self,
@@ -37,8 +63,7 @@ class PlacesClient:
         page_token: Optional[str] = None,
         radius_m: Optional[int] = None,
     ) -> Dict[str, Any]:
-        body = build_text_search_body(query, point, type_filter, page_token, radius_m=radius_m)
-        key = make_request_cache_key(config.PLACES_TEXT_SEARCH_URL, self.field_mask, body)
+        body, key = self._text_search_request(query, point, type_filter, page_token, radius_m)
         if key in self._seen_cache_keys:
             if self.metrics is not None:
                 self.metrics.inc_dedup_skip("places")
@@ -74,15 +99,41 @@ class PlacesClient:
         places: List[Dict[str, Any]] = []
         page_token: Optional[str] = None
         for _ in range(max_pages):
-            resp = self.search_text(
-                query, point, type_filter=type_filter, page_token=page_token, radius_m=radius_m
+            parsed, page_token = self._search_text_page(
+                query, point, type_filter, page_token, radius_m
             )
-            places.extend(parse_places_response(resp))
-            page_token = resp.get("nextPageToken") or resp.get("next_page_token")
+            places.extend(parsed)
             if not page_token:
                 break
         return places
 
+    def _search_text_page(
+        self,
+        query: str,
+        point: Dict[str, Any],
+        type_filter: Optional[str],
+        page_token: Optional[str],
+        radius_m: Optional[int],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        _, key = self._text_search_request(query, point, type_filter, page_token, radius_m)
+        page = self._parsed_cache.get(key)
+        if page is not None:
+            # Same accounting as the dedup branch of search_text.
+            if self.metrics is not None:
+                self.metrics.inc_dedup_skip("places")
+            return page
+        resp = self.search_text(
+            query, point, type_filter=type_filter, page_token=page_token, radius_m=radius_m
+        )
+        page = (
+            parse_places_response(resp),
+            resp.get("nextPageToken") or resp.get("next_page_token"),
+        )
+        if resp and not self.no_cache:
+            # The raw response stays in _memory_cache for search_text dedup hits.
+            self._parsed_cache[key] = page
+        return page
+
     def search_nearby(
         self,
         point: Dict[str, Any],
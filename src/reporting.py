@@ -6,10 +6,14 @@ import json
 import os
 import logging
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, TextIO, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Set, TextIO, Tuple
 
 
 class RequestCounters(Protocol):
@@ -25,6 +29,52 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+def _dumps_compact(value: Any) -> str:
+    # Single-line JSON for CSV cells, JSONL lines and progress snapshots.
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _dumps_pretty(value: Any) -> str:
+    # Indented JSON for the output files. Stays on stdlib json: orjson writes
+    # NaN/Infinity as null and spells exponents differently (1e+16, 1e-07).
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def _peek(rows: Iterable[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    it = iter(rows)
+    try:
+        first = next(it)
+    except StopIteration:
+        return None, iter(())
+    return first, chain([first], it)
+
+
+def _encode_csv_rows(
+    rows: Iterable[Dict[str, Any]],
+    fieldnames: List[str],
+    json_defaults: Dict[str, Any],
+) -> Iterator[List[Any]]:
+    # Positional rows for csv.writer; columns in json_defaults are JSON-encoded.
+    columns = [(name, name in json_defaults, json_defaults.get(name)) for name in fieldnames]
+    # Many rows carry the same query/point/type lists; encode each distinct one once.
+    encoded: Dict[Tuple[str, ...], str] = {}
+
+    def encode(value: Any) -> str:
+        if type(value) is list and all(type(item) is str for item in value):
+            key = tuple(value)
+            text = encoded.get(key)
+            if text is None:
+                text = encoded[key] = _dumps_compact(value)
+            return text
+        return _dumps_compact(value)
+
+    for row in rows:
+        yield [
+            encode(row.get(name, default)) if is_json else row.get(name)
+            for name, is_json, default in columns
+        ]
+
+
 def _fsync_dir(path: str) -> None:
     try:
         dir_fd = os.open(path, os.O_DIRECTORY)
@@ -38,23 +88,105 @@ def _fsync_dir(path: str) -> None:
         os.close(dir_fd)
 
 
+_EPHEMERAL_FS_TYPES = frozenset({"tmpfs", "ramfs"})
+
+
+@lru_cache(maxsize=32)
+def _is_ephemeral_dir(dir_path: str) -> bool:
+    # Longest mount point containing dir_path decides; unknown platforms say no.
+    real = os.path.realpath(dir_path)
+    best_mount, best_type = "", ""
+    try:
+        with open("/proc/self/mounts", "r", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace("\\040", " ")
+                prefix = mount_point.rstrip("/") + "/"
+                if (real == mount_point or real.startswith(prefix)) and len(mount_point) > len(best_mount):
+                    best_mount, best_type = mount_point, fields[2]
+    except OSError:
+        return False
+    return best_type in _EPHEMERAL_FS_TYPES
+
+
+def _default_durable(dir_path: str) -> bool:
+    if os.environ.get("GMR_ATOMIC_OUTPUT", "").strip() == "0":
+        return False
+    return not _is_ephemeral_dir(dir_path)
+
+
+_batch_state = threading.local()
+
+# Output files are small and written once per run; a few workers overlap the I/O.
+_OUTPUT_WRITER_WORKERS = 4
+
+
+class _PendingDirs:
+    # Directories whose fsync is deferred; shared by every worker of a BackgroundWriter.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dirs: Set[str] = set()
+
+    def add(self, dir_path: str) -> None:
+        with self._lock:
+            self._dirs.add(dir_path)
+
+    def fsync_all(self) -> None:
+        with self._lock:
+            dirs, self._dirs = self._dirs, set()
+        for dir_path in sorted(dirs):
+            _fsync_dir(dir_path)
+
+
+@contextmanager
+def atomic_batch(pending: Optional[_PendingDirs] = None) -> Iterator[None]:
+    # Within the block, atomic_writer calls on this thread still fsync their files
+    # but defer the directory fsync to one per directory on exit. With a shared
+    # `pending`, the directories are left for its owner to fsync instead.
+    if getattr(_batch_state, "dirs", None) is not None:
+        yield
+        return
+    dirs = pending if pending is not None else _PendingDirs()
+    _batch_state.dirs = dirs
+    try:
+        yield
+    finally:
+        _batch_state.dirs = None
+        if pending is None:
+            dirs.fsync_all()
+
+
 @contextmanager
 def atomic_writer(
     path: str,
     mode: str = "w",
     encoding: str = "utf-8",
     newline: Optional[str] = None,
+    durable: Optional[bool] = None,
 ) -> Iterator[TextIO]:
+    # durable=False keeps the atomic rename but skips the file/dir fsyncs, for
+    # frequently rewritten files that can be regenerated (e.g. progress.json).
+    # The default fsyncs unless GMR_ATOMIC_OUTPUT=0 or the directory is on tmpfs.
     dir_path = os.path.dirname(path) or "."
+    if durable is None:
+        durable = _default_durable(dir_path)
     base = os.path.basename(path)
     fd, tmp_path = tempfile.mkstemp(prefix=f".{base}.", suffix=".tmp", dir=dir_path)
     try:
         with os.fdopen(fd, mode, encoding=encoding, newline=newline) as f:
             yield f
-            f.flush()
-            os.fsync(f.fileno())
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp_path, path)
-        _fsync_dir(dir_path)
+        if durable:
+            batch_dirs = getattr(_batch_state, "dirs", None)
+            if batch_dirs is not None:
+                batch_dirs.add(dir_path)
+            else:
+                _fsync_dir(dir_path)
     except Exception:
         try:
             os.unlink(tmp_path)
@@ -68,192 +200,210 @@ def atomic_write_text(path: str, text: str) -> None:
         f.write(text)
 
 
-def write_results_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    rows = list(rows)
-    if not rows:
-        with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-            f.write("")
-        return
-
-    fieldnames = [
-        "place_id",
-        "name",
-        "rating",
-        "user_rating_count",
-        "lat",
-        "lon",
-        "business_status",
-        "types",
-        "quality_bayes",
-        "quality_wilson",
-        "quality",
-        "transit_min_minutes",
-        "transit_score",
-        "final",
-        "found_by_queries",
-        "found_by_points",
-        "rejected_reason",
-    ]
+def _write_csv(
+    path: str,
+    rows: Iterable[Dict[str, Any]],
+    fieldnames: List[str],
+    json_defaults: Dict[str, Any],
+    header_if_empty: bool = False,
+) -> None:
+    first, rows = _peek(rows)
     with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            out = dict(row)
-            out["types"] = json.dumps(out.get("types", []), ensure_ascii=False)
-            out["found_by_queries"] = json.dumps(out.get("found_by_queries", []), ensure_ascii=False)
-            out["found_by_points"] = json.dumps(out.get("found_by_points", []), ensure_ascii=False)
-            writer.writerow(out)
+        if first is None and not header_if_empty:
+            return
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(_encode_csv_rows(rows, fieldnames, json_defaults))
+
+
+_RESULTS_CSV_FIELDS = [
+    "place_id",
+    "name",
+    "rating",
+    "user_rating_count",
+    "lat",
+    "lon",
+    "business_status",
+    "types",
+    "quality_bayes",
+    "quality_wilson",
+    "quality",
+    "transit_min_minutes",
+    "transit_score",
+    "final",
+    "found_by_queries",
+    "found_by_points",
+    "rejected_reason",
+]
+_RESULTS_CSV_JSON = {"types": [], "found_by_queries": [], "found_by_points": []}
+
+_LIST_MODE_CSV_FIELDS = [
+    "place_id",
+    "name",
+    "lat",
+    "lon",
+    "rating",
+    "user_rating_count",
+    "business_status",
+    "nearest_hub_id",
+    "min_distance_km_to_any_hub",
+    "quality",
+    "rejected_reason",
+    "found_by_points",
+    "found_by_queries",
+]
+_RADIUS_SCAN_CSV_FIELDS = [
+    "place_id",
+    "name",
+    "lat",
+    "lon",
+    "rating",
+    "user_rating_count",
+    "business_status",
+    "distance_km_to_center",
+    "quality",
+    "rejected_reason",
+    "found_by_points",
+    "found_by_queries",
+]
+_FOUND_BY_CSV_JSON = {"found_by_points": [], "found_by_queries": []}
+
+_RADIUS_SCAN_MERGED_CSV_FIELDS = [
+    "place_id",
+    "name",
+    "lat",
+    "lon",
+    "rating",
+    "user_rating_count",
+    "business_status",
+    "distance_km_by_center",
+    "min_distance_km_to_any_center",
+    "nearest_center_id",
+    "centers_in_range",
+    "quality",
+    "rejected_reason",
+    "found_by_points",
+    "found_by_queries",
+]
+_RADIUS_SCAN_MERGED_CSV_JSON = {
+    "distance_km_by_center": {},
+    "centers_in_range": [],
+    "found_by_points": [],
+    "found_by_queries": [],
+}
+
+_REJECTIONS_CSV_FIELDS = [
+    "place_id",
+    "name",
+    "rating",
+    "user_rating_count",
+    "lat",
+    "lon",
+    "reject_reason",
+    "stage",
+    "found_by_queries",
+]
+_REJECTIONS_CSV_JSON = {"found_by_queries": []}
+
+
+def write_results_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
+    _write_csv(path, rows, _RESULTS_CSV_FIELDS, _RESULTS_CSV_JSON)
 
 
 def write_results_json(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    with atomic_writer(path, mode="w", encoding="utf-8") as f:
-        json.dump(list(rows), f, ensure_ascii=False, indent=2)
+    atomic_write_text(path, _dumps_pretty(list(rows)))
 
 
 def write_json_object(path: str, payload: Dict[str, Any]) -> None:
-    with atomic_writer(path, mode="w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    atomic_write_text(path, _dumps_pretty(payload))
 
 
 def write_list_mode_results_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    rows = list(rows)
-    if not rows:
-        with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-            f.write("")
-        return
-
-    fieldnames = [
-        "place_id",
-        "name",
-        "lat",
-        "lon",
-        "rating",
-        "user_rating_count",
-        "business_status",
-        "nearest_hub_id",
-        "min_distance_km_to_any_hub",
-        "quality",
-        "rejected_reason",
-        "found_by_points",
-        "found_by_queries",
-    ]
-    with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            out = dict(row)
-            out["found_by_points"] = json.dumps(out.get("found_by_points", []), ensure_ascii=False)
-            out["found_by_queries"] = json.dumps(out.get("found_by_queries", []), ensure_ascii=False)
-            writer.writerow(out)
+    _write_csv(path, rows, _LIST_MODE_CSV_FIELDS, _FOUND_BY_CSV_JSON)
 
 
 def write_radius_scan_results_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    rows = list(rows)
-    if not rows:
-        with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-            f.write("")
-        return
-
-    fieldnames = [
-        "place_id",
-        "name",
-        "lat",
-        "lon",
-        "rating",
-        "user_rating_count",
-        "business_status",
-        "distance_km_to_center",
-        "quality",
-        "rejected_reason",
-        "found_by_points",
-        "found_by_queries",
-    ]
-    with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            out = dict(row)
-            out["found_by_points"] = json.dumps(out.get("found_by_points", []), ensure_ascii=False)
-            out["found_by_queries"] = json.dumps(out.get("found_by_queries", []), ensure_ascii=False)
-            writer.writerow(out)
+    _write_csv(path, rows, _RADIUS_SCAN_CSV_FIELDS, _FOUND_BY_CSV_JSON)
 
 
 def write_radius_scan_merged_results_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    rows = list(rows)
-    if not rows:
-        with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-            f.write("")
-        return
-
-    fieldnames = [
-        "place_id",
-        "name",
-        "lat",
-        "lon",
-        "rating",
-        "user_rating_count",
-        "business_status",
-        "distance_km_by_center",
-        "min_distance_km_to_any_center",
-        "nearest_center_id",
-        "centers_in_range",
-        "quality",
-        "rejected_reason",
-        "found_by_points",
-        "found_by_queries",
-    ]
-    with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            out = dict(row)
-            out["distance_km_by_center"] = json.dumps(
-                out.get("distance_km_by_center", {}), ensure_ascii=False
-            )
-            out["centers_in_range"] = json.dumps(
-                out.get("centers_in_range", []), ensure_ascii=False
-            )
-            out["found_by_points"] = json.dumps(out.get("found_by_points", []), ensure_ascii=False)
-            out["found_by_queries"] = json.dumps(out.get("found_by_queries", []), ensure_ascii=False)
-            writer.writerow(out)
+    _write_csv(path, rows, _RADIUS_SCAN_MERGED_CSV_FIELDS, _RADIUS_SCAN_MERGED_CSV_JSON)
 
 
-def write_summary(path: str, summary_lines: List[str]) -> None:
-    atomic_write_text(path, "\n".join(summary_lines))
+def write_summary(path: str, summary_lines: Iterable[str]) -> None:
+    # Summaries are small and re-rendered every run: one binary write plus the
+    # atomic rename, without the text layer or fsyncs.
+    data = "\n".join(summary_lines).encode("utf-8")
+    dir_path = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=dir_path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except Exception:
+            pass
+        raise
 
 
 def write_rejections_csv(path: str, rows: Iterable[Dict[str, Any]]) -> None:
-    rows = list(rows)
-    fieldnames = [
-        "place_id",
-        "name",
-        "rating",
-        "user_rating_count",
-        "lat",
-        "lon",
-        "reject_reason",
-        "stage",
-        "found_by_queries",
-    ]
-    with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            out = dict(row)
-            out["found_by_queries"] = json.dumps(
-                out.get("found_by_queries", []), ensure_ascii=False
-            )
-            writer.writerow(out)
+    _write_csv(path, rows, _REJECTIONS_CSV_FIELDS, _REJECTIONS_CSV_JSON, header_if_empty=True)
 
 
 def write_rejections_jsonl(path: str, rows: Iterable[Dict[str, Any]]) -> None:
     with atomic_writer(path, mode="w", encoding="utf-8", newline="") as f:
         for row in rows:
-            line = json.dumps(row, ensure_ascii=False)
+            line = _dumps_compact(row)
             f.write(line)
             f.write("\n")
 
 
+class BackgroundWriter:
+    # Runs output writers on a small thread pool; each file is written by one
+    # worker, directory fsyncs are deferred to one per directory across all
+    # workers, and leaving the with-block waits for every writer and re-raises
+    # the first failure.
+    def __init__(self, max_workers: int = _OUTPUT_WRITER_WORKERS) -> None:
+        self._max_workers = max(1, int(max_workers))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: List["Future[None]"] = []
+        self._pending_dirs = _PendingDirs()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.join()
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="output-writer"
+            )
+        self._futures.append(self._pool.submit(self._run, fn, args))
+
+    def join(self) -> None:
+        if self._pool is None:
+            return
+        futures, self._futures = self._futures, []
+        error: Optional[BaseException] = None
+        for future in futures:
+            exc = future.exception()
+            if exc is not None and error is None:
+                error = exc
+        self._pool.shutdown(wait=True)
+        self._pool = None
+        self._pending_dirs.fsync_all()
+        if error is not None:
+            raise error
+
+    def _run(self, fn: Callable[..., None], args: Tuple[Any, ...]) -> None:
+        with atomic_batch(self._pending_dirs):
+            fn(*args)
+
+
 class ProgressReporter:
     def __init__(
         self,
@@ -275,13 +425,15 @@ class ProgressReporter:
         self.routes_requests = 0
         self._next_log = self.log_every if self.log_every else 0
         self._last_write = 0.0
+        self._last_written_state: Optional[Tuple[Any, ...]] = None
 
     def set_stage(self, stage: str, total_estimate: Optional[int] = None) -> None:
+        stage_changed = stage != self.stage
         self.stage = stage
         self.processed_count = 0
         self.total_estimate = total_estimate
         self._next_log = self.log_every if self.log_every else 0
-        self._write_if_due(force=True)
+        self._write_if_due(force=stage_changed)
 
     def set_counters(self, counters: Optional[RequestCounters]) -> None:
         self._counters = counters
@@ -337,6 +489,16 @@ class ProgressReporter:
         if not force and (now - self._last_write) < self.write_interval_seconds:
             return
         places_requests, routes_requests = self._get_counts()
+        state = (
+            self.stage,
+            self.processed_count,
+            self.total_estimate,
+            places_requests,
+            routes_requests,
+        )
+        # Nothing moved since the last snapshot; only the timestamp would differ.
+        if state == self._last_written_state:
+            return
         payload = {
             "stage": self.stage,
             "processed_count": self.processed_count,
@@ -345,6 +507,7 @@ class ProgressReporter:
             "routes_requests": routes_requests,
             "timestamp": utc_now_iso(),
         }
-        with atomic_writer(self.output_path, mode="w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        with atomic_writer(self.output_path, mode="w", encoding="utf-8", durable=False) as f:
+            f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
         self._last_write = now
+        self._last_written_state = state
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 from datetime import datetime, time, timedelta, timezone
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from . import config
 from .cache import Cache
-from .http import HttpClient, RequestBudget, RequestMetrics
+from .http import BudgetExceededError, HttpClient, RequestBudget, RequestMetrics
+
+
+_MISSING = object()
 
 
 class RoutesClient:
@@ -27,8 +31,9 @@ class RoutesClient:
         self.no_cache = no_cache
         self.refresh_routes = refresh_routes
         self.field_mask = field_mask
+        self.matrix_field_mask = matrix_field_mask_for(field_mask)
         self.metrics = metrics
-        self._seen_cache_keys: set[str] = set()
+        # Every key seen this run, including ones whose lookup failed (None).
         self._memory_cache: Dict[str, Optional[int]] = {}
 
     def compute_route_duration(
@@ -43,31 +48,144 @@ class RoutesClient:
             departure_time_rfc3339, config.ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES
         )
         cache_key = f"{origin_id}|{destination['place_id']}|{mode}|{dep_bucket}"
-        if cache_key in self._seen_cache_keys:
+        entry = self._memory_cache.get(cache_key, _MISSING)
+        if entry is not _MISSING:
             if self.metrics is not None:
                 self.metrics.inc_dedup_skip("routes")
-            if not self.no_cache and cache_key in self._memory_cache:
-                return self._memory_cache[cache_key]
-            return None
+            return None if self.no_cache else entry
         if not self.no_cache and not self.refresh_routes:
             cached = self.cache.get_routes_cache(cache_key)
             if cached is not None:
                 if self.metrics is not None:
                     self.metrics.inc_cache_hit("routes")
-                self._seen_cache_keys.add(cache_key)
                 self._memory_cache[cache_key] = cached
                 return cached
 
-        self._seen_cache_keys.add(cache_key)
+        # Mark as seen before spending budget so failed lookups are not retried.
+        self._memory_cache[cache_key] = None
         self.budget.consume("routes")
         body = build_routes_body(origin, destination, departure_time_rfc3339, mode)
         response = self.http.post_json(config.ROUTES_COMPUTE_URL, body, self.field_mask)
         duration = parse_routes_duration(response)
+        self._memory_cache[cache_key] = duration
         if not self.no_cache:
             self.cache.set_routes_cache(cache_key, origin_id, destination["place_id"], mode, duration)
-            self._memory_cache[cache_key] = duration
         return duration
 
+    def compute_route_durations_batch(
+        self,
+        origin_id: str,
+        origin: Dict[str, Any],
+        destinations: List[Dict[str, Any]],
+        departure_time_rfc3339: str,
+        mode: str = config.TRANSIT_MODE,
+    ) -> Dict[str, Optional[int]]:
+        # Same cache keys as compute_route_duration; uncached destinations go out
+        # through computeRouteMatrix, one budget unit per matrix element.
+        dep_bucket = _departure_bucket_from_rfc3339(
+            departure_time_rfc3339, config.ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES
+        )
+        results: Dict[str, Optional[int]] = {}
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        for destination in destinations:
+            place_id = destination["place_id"]
+            if place_id in results:
+                continue
+            cache_key = f"{origin_id}|{place_id}|{mode}|{dep_bucket}"
+            entry = self._memory_cache.get(cache_key, _MISSING)
+            if entry is not _MISSING:
+                if self.metrics is not None:
+                    self.metrics.inc_dedup_skip("routes")
+                results[place_id] = None if self.no_cache else entry
+                continue
+            if not self.no_cache and not self.refresh_routes:
+                cached = self.cache.get_routes_cache(cache_key)
+                if cached is not None:
+                    if self.metrics is not None:
+                        self.metrics.inc_cache_hit("routes")
+                    self._memory_cache[cache_key] = cached
+                    results[place_id] = cached
+                    continue
+            results[place_id] = None
+            pending.append((cache_key, destination))
+
+        step = max(1, config.ROUTES_MATRIX_MAX_DESTINATIONS)
+        for start in range(0, len(pending), step):
+            chunk = pending[start:start + step]
+            exhausted: Optional[BudgetExceededError] = None
+            granted = 0
+            for cache_key, _ in chunk:
+                try:
+                    self.budget.consume("routes")
+                except BudgetExceededError as exc:
+                    exhausted = exc
+                    break
+                # Mark as seen before the call so failed lookups are not retried.
+                self._memory_cache[cache_key] = None
+                granted += 1
+            chunk = chunk[:granted]
+            if chunk:
+                body = build_route_matrix_body(
+                    origin, [dest for _, dest in chunk], departure_time_rfc3339, mode
+                )
+                response = self.http.post_json(
+                    config.ROUTES_MATRIX_URL, body, self.matrix_field_mask
+                )
+                durations = parse_route_matrix_durations(response, len(chunk))
+                rows = []
+                for (cache_key, destination), duration in zip(chunk, durations):
+                    place_id = destination["place_id"]
+                    self._memory_cache[cache_key] = duration
+                    results[place_id] = duration
+                    rows.append((cache_key, origin_id, place_id, mode, duration))
+                if not self.no_cache:
+                    self.cache.set_routes_cache_many(rows)
+            if exhausted is not None:
+                raise exhausted
+        return results
+
+
+def matrix_field_mask_for(field_mask: str) -> str:
+    # Route fields ("routes.duration") are top-level on matrix elements.
+    fields = config.ROUTES_MATRIX_FIELD_MASK_MIN.split(",")
+    for field in field_mask.split(","):
+        field = field.strip()
+        if field.startswith("routes."):
+            field = field[len("routes."):]
+        if field and field not in fields:
+            fields.append(field)
+    return ",".join(fields)
+
+
+def _lat_lng_waypoint(point: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "location": {
+            "latLng": {
+                "latitude": point["lat"],
+                "longitude": point["lon"],
+            }
+        }
+    }
+
+
+def build_route_matrix_body(
+    origin: Dict[str, Any],
+    destinations: List[Dict[str, Any]],
+    departure_time_rfc3339: str,
+    mode: str,
+) -> Dict[str, Any]:
+    body = {
+        "origins": [{"waypoint": _lat_lng_waypoint(origin)}],
+        "destinations": [{"waypoint": _lat_lng_waypoint(dest)} for dest in destinations],
+        "travelMode": mode,
+        "departureTime": departure_time_rfc3339,
+    }
+    if config.ROUTES_BODY_EXTRA:
+        body.update(config.ROUTES_BODY_EXTRA)
+    if config.ROUTES_MATRIX_BODY_EXTRA:
+        body.update(config.ROUTES_MATRIX_BODY_EXTRA)
+    return body
+
 
 def build_routes_body(
     origin: Dict[str, Any],
@@ -104,13 +222,38 @@ def parse_routes_duration(response: Dict[str, Any]) -> Optional[int]:
     routes = response.get("routes") or []
     if not routes:
         return None
-    duration = routes[0].get("duration")
+    return _parse_duration(routes[0].get("duration"))
+
+
+def parse_route_matrix_durations(response: Any, count: int) -> List[Optional[int]]:
+    # Elements come back in any order; proto3 JSON omits zero-valued indexes.
+    durations: List[Optional[int]] = [None] * count
+    if isinstance(response, dict):
+        response = [response]
+    for element in response or []:
+        if element.get("originIndex", 0) != 0:
+            continue
+        index = element.get("destinationIndex", 0)
+        if not 0 <= index < count:
+            continue
+        condition = element.get("condition")
+        if condition is not None and condition != "ROUTE_EXISTS":
+            continue
+        durations[index] = _parse_duration(element.get("duration"))
+    return durations
+
+
+def _parse_duration(duration: Any) -> Optional[int]:
     if duration is None:
         return None
     if isinstance(duration, str):
-        # Typically in seconds, like "123s"
+        # Typically whole seconds, like "123s"; fractional values take the float path.
         if duration.endswith("s"):
             duration = duration[:-1]
+        try:
+            return int(duration)
+        except ValueError:
+            pass
         try:
             return int(float(duration))
         except ValueError:
@@ -130,27 +273,33 @@ def compute_departure_time_rfc3339(
     if policy != "next_weekday_17_00":
         raise ValueError(f"Unknown departure policy: {policy}")
 
-    tz = ZoneInfo(config.WARSAW_TIMEZONE)
+    tz = _zone(config.WARSAW_TIMEZONE)
     now = (now_utc or datetime.now(timezone.utc)).astimezone(tz)
     target_time = time(17, 0)
 
-    candidate = datetime.combine(now.date(), target_time, tz)
-    if candidate <= now:
-        candidate = candidate + timedelta(days=1)
-
-    while candidate.weekday() >= 5:  # 5=Sat, 6=Sun
-        candidate = candidate + timedelta(days=1)
+    day = now.date()
+    if now.time() >= target_time:
+        day += timedelta(days=1)
+    weekday = day.weekday()
+    if weekday >= 5:  # 5=Sat, 6=Sun -> next Monday
+        day += timedelta(days=7 - weekday)
+    candidate = datetime.combine(day, target_time, tz)
 
     utc_dt = candidate.astimezone(timezone.utc).replace(microsecond=0)
     return utc_dt.isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=8)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def bucket_departure_key(dt: datetime, bucket_minutes: int) -> str:
     if bucket_minutes <= 0:
         raise ValueError("bucket_minutes must be positive")
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    local = dt.astimezone(ZoneInfo(config.WARSAW_TIMEZONE))
+    local = dt.astimezone(_zone(config.WARSAW_TIMEZONE))
     total_minutes = local.hour * 60 + local.minute
     bucket_start = (total_minutes // bucket_minutes) * bucket_minutes
     bucket_hour = bucket_start // 60
@@ -159,6 +308,16 @@ def bucket_departure_key(dt: datetime, bucket_minutes: int) -> str:
 
 
 def _departure_bucket_from_rfc3339(departure_time_rfc3339: str, bucket_minutes: int) -> str:
+    # A run uses one or two departure strings, so parse each only once.
+    return _departure_bucket_cached(
+        departure_time_rfc3339, bucket_minutes, config.WARSAW_TIMEZONE
+    )
+
+
+@lru_cache(maxsize=1024)
+def _departure_bucket_cached(
+    departure_time_rfc3339: str, bucket_minutes: int, _tz_name: str
+) -> str:
     try:
         ts = departure_time_rfc3339.replace("Z", "+00:00")
         parsed = datetime.fromisoformat(ts)
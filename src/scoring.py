@@ -1,7 +1,8 @@
 """Quality scoring based on Bayesian average and Wilson lower bound."""
 from __future__ import annotations
 
-import math
+from math import sqrt as _sqrt
+from typing import Dict, List, Sequence
 
 
 def bayesian_average(rating: float, v: int, c: float, m: int) -> float:
@@ -14,9 +15,10 @@ def wilson_lower_bound(rating: float, v: int, z: float = 1.96) -> float:
     if v <= 0:
         return 0.0
     p = rating / 5.0
-    denom = 1 + (z ** 2) / v
-    center = p + (z ** 2) / (2 * v)
-    margin = z * math.sqrt((p * (1 - p) + (z ** 2) / (4 * v)) / v)
+    z2 = z * z
+    denom = 1 + z2 / v
+    center = p + z2 / (2 * v)
+    margin = z * _sqrt((p * (1 - p) + z2 / (4 * v)) / v)
     return max(0.0, (center - margin) / denom)
 
 
@@ -31,3 +33,11 @@ def quality_score(rating: float, v: int, c: float, m: int) -> dict:
         "quality_wilson": quality_wilson,
         "quality": quality,
     }
+
+
+def quality_score_batch(
+    ratings: Sequence[float], vs: Sequence[int], c: float, m: int
+) -> List[Dict[str, float]]:
+    if len(ratings) != len(vs):
+        raise ValueError("ratings and vs must have the same length")
+    return [quality_score(rating, v, c, m) for rating, v in zip(ratings, vs)]
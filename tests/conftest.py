@@ -0,0 +1,272 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src import config
+from src.cache import Cache
+from src.gemini_client import BaseGeminiClient, GeminiCallResult
+from src.outreach.crawler import FetchResult
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+_OUTREACH_FIXTURES = _FIXTURES / "outreach"
+_FAKE_SITE_ROOT = "http://clinic.test"
+
+# In-memory caches never need durability; skip journaling and syncs entirely.
+_MEMORY_PRAGMAS = """
+PRAGMA journal_mode=MEMORY;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-32000;
+PRAGMA locking_mode=EXCLUSIVE;
+"""
+
+
+@pytest.fixture
+def sqlite_cache_factory():
+    caches = []
+
+    def make(cache_cls=Cache):
+        cache = cache_cls(":memory:")
+        cache.conn.executescript(_MEMORY_PRAGMAS)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+@pytest.fixture
+def sqlite_cache(sqlite_cache_factory):
+    return sqlite_cache_factory()
+
+
+@pytest.fixture
+def seed_cache():
+    # Stage all rows, then write them in a single commit.
+    def seed(cache, search_rows=(), routes_rows=()):
+        cache.set_search_cache_many(search_rows)
+        cache.set_routes_cache_many(list(routes_rows))
+        cache.commit()
+
+    return seed
+
+
+def _load_json_fixture(name: str) -> Any:
+    data = (_FIXTURES / name).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Recorded API responses, parsed once per session; the offline fakes only read them.
+@pytest.fixture(scope="session")
+def places_fixture():
+    return _load_json_fixture("places_text_search.json")
+
+
+@pytest.fixture(scope="session")
+def routes_fixture():
+    return _load_json_fixture("routes_compute_routes.json")
+
+
+@pytest.fixture(scope="module")
+def offline_query_config():
+    # Query/filter settings shared by the offline list-mode and radius-scan tests.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
+        mp.setattr(config, "GENERAL_QUERIES", [])
+        mp.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
+        mp.setattr(config, "MIN_USER_RATING_COUNT", 10)
+        yield
+
+
+@pytest.fixture(scope="session")
+def outreach_template_path() -> Path:
+    path = (Path(__file__).parent.parent / "prompts" / "email_template_no_pricing_pl.txt").resolve()
+    assert path.exists()
+    return path
+
+
+@pytest.fixture(scope="session")
+def single_clinic_csv(tmp_path_factory) -> Path:
+    # One-row outreach input on the fake clinic host; run_outreach only reads it, so it is written once.
+    path = tmp_path_factory.mktemp("outreach_input") / "input.csv"
+    path.write_text(
+        "place_id,name,quality,rating,user_rating_count,website\n"
+        "id-1,Clinic Test,100,5.0,200,http://clinic.test/\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def fake_outreach_fetcher():
+    # Static fake clinic site for the outreach crawler; fixtures are read once per session.
+    kontakt = (_OUTREACH_FIXTURES / "kontakt.html").read_text(encoding="utf-8")
+    html_by_path = {
+        "/": (_OUTREACH_FIXTURES / "site_root.html").read_text(encoding="utf-8"),
+        "/cennik": (_OUTREACH_FIXTURES / "cennik.html").read_text(encoding="utf-8"),
+        "/kontakt": kontakt,
+        "/kontakt/wyslij": kontakt,
+        "/about": "<html><body>O nas</body></html>",
+    }
+    # The crawler only ever asks for absolute URLs on the fake host, so key by them directly.
+    # FetchResult is frozen, so each page's result is built once and shared.
+    html_by_url = {_FAKE_SITE_ROOT + path: html for path, html in html_by_path.items()}
+    html_by_url[_FAKE_SITE_ROOT] = html_by_path["/"]
+    results = {
+        url: FetchResult(
+            url=url,
+            final_url=url,
+            status_code=200,
+            content_type="text/html",
+            text=html,
+            error=None,
+            from_cache=False,
+        )
+        for url, html in html_by_url.items()
+    }
+    not_found = FetchResult(
+        url="",
+        final_url="",
+        status_code=404,
+        content_type="text/html",
+        text="",
+        error="not_found",
+        from_cache=False,
+    )
+
+    def fetcher(url: str) -> FetchResult:
+        result = results.get(url)
+        if result is None:
+            return replace(not_found, url=url, final_url=url)
+        return result
+
+    return fetcher
+
+
+_FAKE_PRICE_CALC_DATA = {
+    "clinic_name": "Clinic Test",
+    "currency": "PLN",
+    "evidence_level": "strong",
+    "extracted_prices": [
+        {
+            "key": "bonding_metal_1_arch",
+            "label": "Aparat stały metalowy 1 łuk",
+            "amount": 2800,
+            "source": "explicit",
+            "notes": "z cennika",
+        }
+    ],
+    "variants": {
+        "A": {
+            "total": 7000,
+            "breakdown": {
+                "start": 450,
+                "bonding": 2800,
+                "controls": 3080,
+                "debonding": 0,
+                "retention": 670,
+            },
+            "missing": ["debond 1 arch"],
+            "missing_items_count": 1,
+            "fallback_items_count": 2,
+            "fallback_total_pln": 1120,
+            "fallback_share_pct": 16,
+            "confidence": "medium",
+            "assumptions": ["fallback debonding"],
+        },
+        "B": {
+            "total": 14000,
+            "breakdown": {
+                "start": 450,
+                "bonding": 5600,
+                "controls": 6300,
+                "debonding": 0,
+                "retention": 1650,
+            },
+            "missing": ["debond 1 arch", "fixed retainer 1 arch"],
+            "missing_items_count": 2,
+            "fallback_items_count": 3,
+            "fallback_total_pln": 1950,
+            "fallback_share_pct": 14,
+            "confidence": "medium",
+            "assumptions": [],
+        },
+        "C": {
+            "total": 15000,
+            "breakdown": {
+                "start": 450,
+                "bonding": 5600,
+                "controls": 7000,
+                "debonding": 0,
+                "retention": 1950,
+            },
+            "missing": ["debond 1 arch"],
+            "missing_items_count": 1,
+            "fallback_items_count": 3,
+            "fallback_total_pln": 1950,
+            "fallback_share_pct": 13,
+            "confidence": "medium",
+            "assumptions": [],
+        },
+    },
+    "notes": ["deterministic fake"],
+}
+_FAKE_PRICE_CALC_RAW = json.dumps(_FAKE_PRICE_CALC_DATA, ensure_ascii=False)
+
+_FAKE_OUTREACH_MESSAGE_DATA = {
+    "clinic_name": "Clinic Test",
+    "subject": "Prośba o brakujące informacje cenowe",
+    "body": "Dzień dobry, proszę o brakujące ceny.",
+    "questions_missing_prices": ["debond 1 arch"],
+    "template_preservation_check": {
+        "preserved_phrase_1": True,
+        "preserved_phrase_2": True,
+    },
+}
+_FAKE_OUTREACH_MESSAGE_RAW = json.dumps(_FAKE_OUTREACH_MESSAGE_DATA, ensure_ascii=False)
+
+
+class FakeGeminiClient(BaseGeminiClient):
+    # Deterministic Gemini stand-in for the outreach tests; counts calls for cache assertions.
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def reset(self) -> None:
+        self.call_count = 0
+
+    def generate_json(self, prompt_name, prompt_text, prompt_hash, validator=None):
+        self.call_count += 1
+        if prompt_name == "gemini_price_calc_v3.txt":
+            data, raw_text = _FAKE_PRICE_CALC_DATA, _FAKE_PRICE_CALC_RAW
+        else:
+            data, raw_text = _FAKE_OUTREACH_MESSAGE_DATA, _FAKE_OUTREACH_MESSAGE_RAW
+
+        if validator is not None:
+            validator(data)
+        return GeminiCallResult(
+            status="ok",
+            raw_text=raw_text,
+            data=data,
+            model="fake",
+            prompt_name=prompt_name,
+            prompt_hash=prompt_hash,
+            error=None,
+        )
+
+
+@pytest.fixture(scope="session")
+def fake_gemini():
+    # The fake holds no per-run state besides call_count; tests asserting on it call reset() first.
+    return FakeGeminiClient()
+
@@ -1,4 +1,4 @@
-from src.coverage import compute_uplift, unique_contributions
+from src.coverage import build_grid, compute_uplift, unique_contributions
 
 
 def test_compute_uplift_and_threshold():
@@ -19,3 +19,14 @@ def test_unique_contributions():
     assert contributions["q1"] == 1  # only "a"
     assert contributions["q2"] == 1  # only "d"
     assert contributions["q3"] == 1  # only "e"
+
+
+def test_build_grid_drops_coincident_points():
+    bbox = {"lat_min": 52.0, "lat_max": 52.0003, "lon_min": 21.0, "lon_max": 21.0003}
+    assert len(build_grid(bbox, 3)) == 9
+
+    line = {"lat_min": 52.0, "lat_max": 52.0, "lon_min": 21.0, "lon_max": 21.0001}
+    assert [p["id"] for p in build_grid(line, 3)] == ["grid_0_0", "grid_0_1", "grid_0_2"]
+
+    point = {"lat_min": 52.0, "lat_max": 52.0, "lon_min": 21.0, "lon_max": 21.0}
+    assert [p["id"] for p in build_grid(point, 3)] == ["grid_0_0"]
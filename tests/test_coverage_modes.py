@@ -1,17 +1,8 @@
-import json
-from pathlib import Path
-
 import pytest
 
 from src import config, pipeline
 
 
-def load_fixture(name: str):
-    path = Path(__file__).parent / "fixtures" / name
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def make_fake_http_client(fixture):
     class FakeHttpClient:
         def __init__(self, *args, **kwargs):
@@ -38,8 +29,7 @@ def patch_basic_config(monkeypatch, hubs):
     )
 
 
-def test_coverage_off_skips_and_completes(monkeypatch):
-    places_fixture = load_fixture("places_text_search.json")
+def test_coverage_off_skips_and_completes(monkeypatch, places_fixture):
     fake_http = make_fake_http_client(places_fixture)
     monkeypatch.setattr(pipeline, "HttpClient", fake_http)
 
@@ -69,8 +59,7 @@ def test_coverage_off_skips_and_completes(monkeypatch):
     assert coverage["skipped"] is True
 
 
-def test_coverage_light_within_budget(monkeypatch):
-    places_fixture = load_fixture("places_text_search.json")
+def test_coverage_light_within_budget(monkeypatch, places_fixture):
     fake_http = make_fake_http_client(places_fixture)
     monkeypatch.setattr(pipeline, "HttpClient", fake_http)
 
@@ -103,8 +92,7 @@ def test_coverage_light_within_budget(monkeypatch):
     assert coverage["coverage_consumed"] <= coverage["coverage_cap"]
 
 
-def test_coverage_full_stops_on_cap(monkeypatch):
-    places_fixture = load_fixture("places_text_search.json")
+def test_coverage_full_stops_on_cap(monkeypatch, places_fixture):
     fake_http = make_fake_http_client(places_fixture)
     monkeypatch.setattr(pipeline, "HttpClient", fake_http)
 
@@ -134,3 +122,29 @@ def test_coverage_full_stops_on_cap(monkeypatch):
     assert coverage["stopped_early"] is True
     assert coverage["coverage_cap"] == 2
     assert coverage["coverage_consumed"] == 2
+
+
+def test_coverage_check_u_hubs_counts_only_hub_coverage_queries():
+    class NoResultsPlacesClient:
+        def search_text_all(self, query, point, type_filter=None, max_pages=1, radius_m=None):
+            return []
+
+    hubs = [{"id": "hub1", "name": "Hub 1", "lat": 52.2, "lon": 21.0}]
+    results_by_query_point = {
+        ("ortodonta", "hub1"): {"a", "b"},
+        ("ortodonta", "grid_0_0"): {"c"},
+        ("dentysta", "hub1"): {"d"},
+    }
+
+    stats = pipeline.coverage_check(
+        NoResultsPlacesClient(),
+        hubs,
+        lambda *args: None,
+        results_by_query_point,
+        coverage_queries=["ortodonta"],
+        grid_size_initial=2,
+        grid_max_iterations=0,
+    )
+
+    assert stats["u_hubs"] == 2
+    assert stats["u_union_total"] == 2
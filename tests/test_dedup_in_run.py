@@ -1,13 +1,24 @@
+import copy
+from collections import Counter
 from datetime import datetime, timezone
 
+import pytest
+
 from src import config
 from src.cache import Cache, make_request_cache_key
-from src.http import HttpClient, RequestBudget, RequestMetrics
+from src.http import BudgetExceededError, HttpClient, RequestBudget, RequestMetrics
 from src.places_client import PlacesClient, build_text_search_body
 from src.routes_client import RoutesClient, bucket_departure_key
 
 
+_EMPTY: dict = {}
+_DEPARTURE_STR = "2026-01-26T16:00:00Z"
+_DEPARTURE_DT = datetime(2026, 1, 26, 16, 0, tzinfo=timezone.utc)
+
+
 class FakeResponse:
+    __slots__ = ("_payload", "status_code", "headers")
+
     def __init__(self, payload):
         self._payload = payload
         self.status_code = 200
@@ -21,24 +32,31 @@ class FakeResponse:
 
 
 class FakeSession:
+    __slots__ = ("responses_by_url", "calls")
+
     def __init__(self, responses_by_url):
         self.responses_by_url = responses_by_url
         self.calls = []
 
     def post(self, url, data=None, headers=None, timeout=None):
         self.calls.append(url)
-        payload = self.responses_by_url.get(url, {})
+        responses_by_url = self.responses_by_url
+        payload = responses_by_url[url] if url in responses_by_url else _EMPTY
         return FakeResponse(payload)
 
 
+# Built once; each test gets a shallow copy with its own FakeSession.
+_HTTP_CLIENT_TEMPLATE = HttpClient(
+    api_key="dummy",
+    timeout=1,
+    retry_max=1,
+    backoff_base=0.0,
+    backoff_max=0.0,
+)
+
+
 def make_http_client(responses_by_url):
-    client = HttpClient(
-        api_key="dummy",
-        timeout=1,
-        retry_max=1,
-        backoff_base=0.0,
-        backoff_max=0.0,
-    )
+    client = copy.copy(_HTTP_CLIENT_TEMPLATE)
     client.session = FakeSession(responses_by_url)
     return client
 
@@ -58,8 +76,8 @@ class CountingCache(Cache):
         return super().get_routes_cache(key)
 
 
-def test_places_dedup_with_cached_response():
-    cache = CountingCache(":memory:")
+def test_places_dedup_with_cached_response(sqlite_cache_factory, seed_cache):
+    cache = sqlite_cache_factory(CountingCache)
     responses = {config.PLACES_TEXT_SEARCH_URL: {"places": [{"id": "p1"}]}}
     http_client = make_http_client(responses)
     budget = RequestBudget(max_places=10, max_routes=10)
@@ -69,7 +87,7 @@ def test_places_dedup_with_cached_response():
     body = build_text_search_body("ortodonta", point, None, None)
     key = make_request_cache_key(config.PLACES_TEXT_SEARCH_URL, places_client.field_mask, body)
     cached_payload = {"places": [{"id": "p1"}]}
-    cache.set_search_cache(key, cached_payload)
+    seed_cache(cache, search_rows=[(key, cached_payload)])
 
     first = places_client.search_text("ortodonta", point)
     second = places_client.search_text("ortodonta", point)
@@ -78,11 +96,10 @@ def test_places_dedup_with_cached_response():
     assert second == cached_payload
     assert http_client.session.calls == []
     assert cache.search_calls == 1
-    cache.close()
 
 
-def test_routes_dedup_with_cached_response():
-    cache = CountingCache(":memory:")
+def test_routes_dedup_with_cached_response(sqlite_cache_factory, seed_cache):
+    cache = sqlite_cache_factory(CountingCache)
     responses = {config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]}}
     http_client = make_http_client(responses)
     budget = RequestBudget(max_places=10, max_routes=10)
@@ -92,11 +109,10 @@ def test_routes_dedup_with_cached_response():
 
     origin = {"lat": 52.2, "lon": 21.0}
     dest = {"place_id": "p0", "lat": 52.2, "lon": 21.0}
-    departure = "2026-01-26T16:00:00Z"
-    dep_dt = datetime.fromisoformat(departure.replace("Z", "+00:00")).astimezone(timezone.utc)
-    dep_bucket = bucket_departure_key(dep_dt, config.ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES)
+    departure = _DEPARTURE_STR
+    dep_bucket = bucket_departure_key(_DEPARTURE_DT, config.ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES)
     routes_key = f"hub|{dest['place_id']}|{config.TRANSIT_MODE}|{dep_bucket}"
-    cache.set_routes_cache(routes_key, "hub", dest["place_id"], config.TRANSIT_MODE, 123)
+    seed_cache(cache, routes_rows=[(routes_key, "hub", dest["place_id"], config.TRANSIT_MODE, 123)])
 
     first = routes_client.compute_route_duration("hub", origin, dest, departure)
     second = routes_client.compute_route_duration("hub", origin, dest, departure)
@@ -105,11 +121,10 @@ def test_routes_dedup_with_cached_response():
     assert second == 123
     assert http_client.session.calls == []
     assert cache.routes_calls == 1
-    cache.close()
 
 
-def test_dedup_without_cache_skips_network_on_second_call():
-    cache = Cache(":memory:")
+def test_dedup_without_cache_skips_network_on_second_call(sqlite_cache):
+    cache = sqlite_cache
     responses = {
         config.PLACES_TEXT_SEARCH_URL: {"places": [{"id": "p1"}]},
         config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]},
@@ -126,7 +141,7 @@ def test_dedup_without_cache_skips_network_on_second_call():
     first_places = places_client.search_text("ortodonta", point)
     second_places = places_client.search_text("ortodonta", point)
 
-    departure = "2026-01-26T16:00:00Z"
+    departure = _DEPARTURE_STR
     dest = {"place_id": "p0", "lat": 52.2, "lon": 21.0}
     first_route = routes_client.compute_route_duration("hub", point, dest, departure)
     second_route = routes_client.compute_route_duration("hub", point, dest, departure)
@@ -135,8 +150,29 @@ def test_dedup_without_cache_skips_network_on_second_call():
     assert second_places == {}
     assert first_route == 120
     assert second_route is None
-    assert http_client.session.calls.count(config.PLACES_TEXT_SEARCH_URL) == 1
-    assert http_client.session.calls.count(config.ROUTES_COMPUTE_URL) == 1
+    calls_by_url = Counter(http_client.session.calls)
+    assert calls_by_url[config.PLACES_TEXT_SEARCH_URL] == 1
+    assert calls_by_url[config.ROUTES_COMPUTE_URL] == 1
     assert metrics.dedup_skips_places == 1
     assert metrics.dedup_skips_routes == 1
-    cache.close()
+
+
+def test_routes_key_marked_seen_when_budget_exhausted(sqlite_cache):
+    cache = sqlite_cache
+    responses = {config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]}}
+    http_client = make_http_client(responses)
+    metrics = RequestMetrics()
+    budget = RequestBudget(max_places=10, max_routes=0, metrics=metrics)
+    routes_client = RoutesClient(
+        http_client, cache, budget, no_cache=False, refresh_routes=True, metrics=metrics
+    )
+
+    origin = {"lat": 52.2, "lon": 21.0}
+    dest = {"place_id": "p0", "lat": 52.2, "lon": 21.0}
+    departure = _DEPARTURE_STR
+    with pytest.raises(BudgetExceededError):
+        routes_client.compute_route_duration("hub", origin, dest, departure)
+
+    assert routes_client.compute_route_duration("hub", origin, dest, departure) is None
+    assert http_client.session.calls == []
+    assert metrics.dedup_skips_routes == 1
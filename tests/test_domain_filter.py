@@ -1,5 +1,5 @@
 from src import config
-from src.pipeline import apply_filters
+from src.pipeline import apply_filters, domain_reject_mask
 
 
 def _place(
@@ -39,6 +39,7 @@ def test_domain_filter_rejects_veterinary_dentist():
         assert filtered == []
         assert rejection_counts.get("irrelevant_domain") == 1
         assert places_by_id["vet1"]["rejected_reason"] == "irrelevant_domain"
+        assert domain_reject_mask(["Veterinary dentist", "Avenue Dental", None]) == [True, False, False]
     finally:
         config.DOMAIN_REJECT_NAME_SUBSTRINGS = original
 
@@ -56,3 +57,14 @@ def test_domain_filter_keeps_relevant_dental_clinics():
     assert filtered_ids == {"d1", "o1"}
     assert "irrelevant_domain" not in rejection_counts
     assert all("rejected_reason" not in places_by_id[p] for p in places_by_id)
+
+
+def test_domain_reject_mask_follows_config_changes(monkeypatch):
+    monkeypatch.setattr(config, "DOMAIN_REJECT_NAME_SUBSTRINGS", ["vet", "a.b"])
+    assert domain_reject_mask(["VET clinic", "axb", "A.B dental"]) == [True, False, True]
+
+    monkeypatch.setattr(config, "DOMAIN_REJECT_NAME_SUBSTRINGS", ["", "zoo"])
+    assert domain_reject_mask(["VET clinic", "Zoo dental"]) == [False, True]
+
+    monkeypatch.setattr(config, "DOMAIN_REJECT_NAME_SUBSTRINGS", [""])
+    assert domain_reject_mask(["anything", None]) == [False, False]
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Dict
 
+import pytest
+
 from scripts.enrich_websites_from_places import (
     EnrichSummary,
     _extract_place_id_from_url,
@@ -18,20 +20,30 @@ class _FakeResponse:
         return dict(self._payload)
 
 
+_ROWS = (
+    {"name": "Clinic A", "place_id": "p1", "website": ""},
+    {"name": "Clinic B", "place_id": "p2"},
+    {"name": "Clinic A Duplicate", "place_id": "p1"},
+)
+_ROWS_JSON = json.dumps(_ROWS, ensure_ascii=False, indent=2).encode("utf-8")
+_NO_PLACE_ID_JSON = json.dumps([{"name": "No Place Id"}], indent=2).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def enrich_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("enrich")
+
 
-def _write_input(path: Path) -> None:
-    rows = [
-        {"name": "Clinic A", "place_id": "p1", "website": ""},
-        {"name": "Clinic B", "place_id": "p2"},
-        {"name": "Clinic A Duplicate", "place_id": "p1"},
-    ]
-    path.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+@pytest.fixture
+def io_paths(enrich_dir: Path, request):
+    # Tests share one directory; prefix files with the test name to keep them apart.
+    name = request.node.name
+    return enrich_dir / f"{name}_results.json", enrich_dir / f"{name}_results_with_websites.json"
 
 
-def test_enrich_websites_fills_missing_and_preserves_order(tmp_path: Path) -> None:
-    input_path = tmp_path / "results.json"
-    output_path = tmp_path / "results_with_websites.json"
-    _write_input(input_path)
+def test_enrich_websites_fills_missing_and_preserves_order(io_paths) -> None:
+    input_path, output_path = io_paths
+    input_path.write_bytes(_ROWS_JSON)
 
     details_by_id = {
         "p1": {
@@ -74,7 +86,8 @@ def test_enrich_websites_fills_missing_and_preserves_order(tmp_path: Path) -> No
     assert calls["api_key"] == "test-key"
     assert "websiteUri" in calls["field_mask"]
 
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
+    with output_path.open("rb") as f:
+        rows = json.load(f)
     names = [row.get("name") for row in rows]
     assert names == ["Clinic A", "Clinic B", "Clinic A Duplicate"]
 
@@ -85,10 +98,9 @@ def test_enrich_websites_fills_missing_and_preserves_order(tmp_path: Path) -> No
     assert by_name["Clinic A Duplicate"]["website"] == "https://clinic-a.example"
 
 
-def test_missing_place_id_does_not_call_api(tmp_path: Path) -> None:
-    input_path = tmp_path / "results.json"
-    output_path = tmp_path / "results_with_websites.json"
-    input_path.write_text(json.dumps([{"name": "No Place Id"}], indent=2), encoding="utf-8")
+def test_missing_place_id_does_not_call_api(io_paths) -> None:
+    input_path, output_path = io_paths
+    input_path.write_bytes(_NO_PLACE_ID_JSON)
 
     calls = {"count": 0}
 
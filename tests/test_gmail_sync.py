@@ -1,12 +1,21 @@
 import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from src.gmail_sync import compute_time_window, load_sync_state, sync_gmail_replies
 
 
 class FakeGmailClient:
+    __slots__ = (
+        "_messages",
+        "_messages_by_id",
+        "_profile_email",
+        "_raise_on_list",
+        "list_calls",
+        "get_calls",
+    )
+
     def __init__(
         self,
         *,
@@ -36,16 +45,19 @@ class FakeGmailClient:
         return self._messages_by_id.get(message_id) or {}
 
 
-def _ms(dt: datetime) -> str:
-    return str(int(dt.timestamp() * 1000))
+_DATE_HEADER = {"name": "Date", "value": "Tue, 27 Jan 2026 15:00:00 +0000"}
+
 
+def _ms(dt: datetime, _mul: int = 1000) -> str:
+    return str(int(dt.timestamp() * _mul))
 
-def _headers(from_val: str, subject: str) -> List[Dict[str, str]]:
-    return [
+
+def _headers(from_val: str, subject: str) -> Tuple[Dict[str, str], ...]:
+    return (
         {"name": "From", "value": from_val},
         {"name": "Subject", "value": subject},
-        {"name": "Date", "value": "Tue, 27 Jan 2026 15:00:00 +0000"},
-    ]
+        _DATE_HEADER,
+    )
 
 
 def test_compute_time_window_uses_last_sync_with_grace() -> None:
@@ -159,7 +171,8 @@ def test_sync_filters_old_messages_and_updates_state_and_latest_reply(tmp_path:
     assert state_payload.get("last_successful_sync_utc") == "2026-01-27T15:00:00Z"
     assert "m-new" in (state_payload.get("seen_message_ids") or [])
 
-    updated_results = json.loads(results_path.read_text(encoding="utf-8"))
+    with results_path.open("rb") as f:
+        updated_results = json.load(f)
     assert updated_results[0].get("latest_reply", {}).get("message_id") == "m-new"
 
 
@@ -1,12 +1,13 @@
 import json
 
 from src import config
+from src.geo import haversine_km, prepare_hubs
 from src.pipeline import compute_min_distance_km_to_any_hub, run
 
 
 class FakePlacesClient:
     def __init__(self, places):
-        self.places = places
+        self.places = tuple(places)
         self.budget = None
         self.metrics = None
 
@@ -17,7 +18,7 @@ class FakePlacesClient:
         self.metrics = metrics
 
     def search_text_all(self, query, point, type_filter=None, max_pages=None):
-        return list(self.places)
+        return self.places
 
 
 class FakeRoutesClient:
@@ -47,9 +48,11 @@ def test_min_distance_and_nearest_hub():
     assert hub_id == "h1"
     assert dist is not None
     assert dist >= 0.0
+    assert dist == haversine_km(0.0, 0.2, 0.0, 0.0)
+    assert compute_min_distance_km_to_any_hub(place, hubs, prepare_hubs(hubs)) == (dist, hub_id)
 
 
-def test_list_mode_outputs_and_skips_routes(tmp_path, monkeypatch):
+def test_list_mode_outputs_and_skips_routes(tmp_path, monkeypatch, offline_query_config):
     monkeypatch.setattr(
         config,
         "HUBS",
@@ -58,10 +61,6 @@ def test_list_mode_outputs_and_skips_routes(tmp_path, monkeypatch):
             "h2": {"name": "Hub2", "lat": 1.0, "lon": 2.0},
         },
     )
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", [])
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-    monkeypatch.setattr(config, "MIN_USER_RATING_COUNT", 10)
     monkeypatch.setattr(config, "MAX_DISTANCE_KM", 50.0)
 
     places = [
@@ -118,9 +117,8 @@ def test_list_mode_outputs_and_skips_routes(tmp_path, monkeypatch):
     assert summary_path.exists()
 
     header = csv_path.read_text(encoding="utf-8").splitlines()[0]
-    assert "place_id" in header
-    assert "nearest_hub_id" in header
-    assert "min_distance_km_to_any_hub" in header
+    columns = set(header.split(","))
+    assert {"place_id", "nearest_hub_id", "min_distance_km_to_any_hub"} <= columns
 
     data = json.loads(json_path.read_text(encoding="utf-8"))
     assert isinstance(data, list)
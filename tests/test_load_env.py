@@ -6,14 +6,14 @@ import run
 
 def _parse_env_file(env_path: Path, *, override: bool = False) -> None:
     for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+        key, sep, val = line.partition("=")
+        if not sep:
             continue
-        key, val = line.split("=", 1)
         key = key.strip()
-        val = val.strip()
+        if not key or key[0] == "#":
+            continue
         if override or key not in os.environ:
-            os.environ[key] = val
+            os.environ[key] = val.strip()
 
 
 def test_load_env_is_optional_and_does_not_override_env(tmp_path: Path, monkeypatch):
@@ -1,12 +1,12 @@
 import json
 
 from src import config
-from src.pipeline import run
+from src.pipeline import render_radius_scan_merged_summary, run
 
 
 class FakePlacesClient:
     def __init__(self, places):
-        self.places = places
+        self.places = tuple(places)
         self.budget = None
         self.metrics = None
 
@@ -17,7 +17,7 @@ class FakePlacesClient:
         self.metrics = metrics
 
     def search_text_all(self, query, point, type_filter=None, max_pages=None, radius_m=None):
-        return list(self.places)
+        return self.places
 
 
 class FakeRoutesClient:
@@ -35,7 +35,7 @@ class FakeRoutesClient:
         return None
 
 
-def test_multi_center_radius_scan_merge(tmp_path, monkeypatch):
+def test_multi_center_radius_scan_merge(tmp_path, monkeypatch, offline_query_config):
     monkeypatch.setattr(
         config,
         "HUBS",
@@ -44,10 +44,6 @@ def test_multi_center_radius_scan_merge(tmp_path, monkeypatch):
             "c2": {"name": "C2", "lat": 1.0, "lon": 2.0},
         },
     )
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", [])
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-    monkeypatch.setattr(config, "MIN_USER_RATING_COUNT", 10)
 
     places = [
         {
@@ -108,7 +104,8 @@ def test_multi_center_radius_scan_merge(tmp_path, monkeypatch):
 
     merged_json = out_dir / "radius_scan_merged_results.json"
     assert merged_json.exists()
-    data = json.loads(merged_json.read_text(encoding="utf-8"))
+    with merged_json.open("rb") as f:
+        data = json.load(f)
     assert isinstance(data, list)
     by_id = {row["place_id"]: row for row in data}
     overlap = by_id["p_overlap"]
@@ -127,3 +124,19 @@ def test_multi_center_radius_scan_merge(tmp_path, monkeypatch):
         assert (center_dir / "radius_scan_results.csv").exists()
         assert (center_dir / "radius_scan_results.json").exists()
         assert (center_dir / "radius_scan_summary.txt").exists()
+
+
+def test_merged_summary_lists_centers_in_sorted_order():
+    summary = {
+        "per_center_unique_counts": {"c2": 5, "c1": 3},
+        "per_center_budget_exceeded": {"c2": False, "c1": True},
+        "rejection_counts": {},
+        "top50": [],
+    }
+
+    lines = render_radius_scan_merged_summary(summary)
+
+    counts_idx = lines.index("Per-center unique counts:")
+    budget_idx = lines.index("Per-center budget exceeded:")
+    assert lines[counts_idx + 1 : budget_idx] == ["  - c1: 3", "  - c2: 5"]
+    assert lines[budget_idx + 1 : budget_idx + 3] == ["  - c1: True", "  - c2: False"]
@@ -31,3 +31,24 @@ def test_ortho_relevance_affects_ranking():
 def test_ortho_relevance_defaults_to_base_when_no_provenance():
     place = {"name": "Dental Clinic"}
     assert pipeline.compute_ortho_relevance(place) == 50.0
+
+
+def test_compute_final_scores_matches_scalar_scorer():
+    rows = [(90.0, 80.0, 75.0), (70.0, None, 50.0), (None, 10.0, 0.0)]
+    expected = [pipeline.compute_final_score(*row) for row in rows]
+    assert pipeline.compute_final_scores(rows) == expected
+
+
+def test_compute_ortho_relevance_all_matches_scalar(monkeypatch):
+    monkeypatch.setattr(config, "ORTHO_QUERY_HINTS", ["ortho"])
+    monkeypatch.setattr(config, "ORTHO_GENERIC_QUERY_HINTS", ["dent"])
+    monkeypatch.setattr(config, "GENERAL_QUERIES", ["dentist"])
+    places = [
+        {"name": "A", "found_by": [{"query": "orthodontist"}, {"query": "dentist"}]},
+        {"name": "B", "found_by": [{"query": "dentist"}]},
+        {"name": "C", "found_by": [{"query": "dentist", "group": "ortho"}]},
+        {"name": "D"},
+    ]
+    expected = [pipeline.compute_ortho_relevance(place) for place in places]
+    assert pipeline.compute_ortho_relevance_all(places) == expected
+    assert expected[1] < expected[2] < expected[0]
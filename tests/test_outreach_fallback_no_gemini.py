@@ -56,31 +56,18 @@ class FailingGeminiClient(BaseGeminiClient):
         )
 
 
-def _template_path() -> Path:
-    return Path("prompts/email_template_no_pricing_pl.txt").resolve()
-
-
-def _write_csv(path: Path) -> None:
-    with path.open("w", encoding="utf-8", newline="") as f:
-        f.write("place_id,name,quality,rating,user_rating_count,website\n")
-        f.write("id-1,Clinic One,100,5.0,200,http://clinic.test/\n")
-
-
-def test_fallback_outreach_message_when_gemini_fails(tmp_path: Path) -> None:
-    csv_path = tmp_path / "input.csv"
-    _write_csv(csv_path)
-    template_path = _template_path()
-    assert template_path.exists()
-
+def test_fallback_outreach_message_when_gemini_fails(
+    tmp_path: Path, single_clinic_csv: Path, outreach_template_path: Path
+) -> None:
     result = run_outreach(
-        input_csv_path=str(csv_path),
+        input_csv_path=str(single_clinic_csv),
         out_dir=tmp_path / "outreach_fallback",
         top_n=1,
         max_pages=5,
         refresh_web=True,
         fetcher=_fake_fetcher,
         gemini_client=FailingGeminiClient(),
-        template_path=template_path,
+        template_path=outreach_template_path,
     )
 
     payload = json.loads(result.results_path.read_text(encoding="utf-8"))
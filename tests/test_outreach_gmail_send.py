@@ -1,151 +1,10 @@
+import csv
 import json
 from pathlib import Path
-from typing import Dict
-from urllib.parse import urlparse
 
-from src.gemini_client import BaseGeminiClient, GeminiCallResult
-from src.outreach.crawler import FetchResult
-from src.outreach.pipeline_outreach import run_outreach
-
-
-def _fixture_path(name: str) -> Path:
-    return Path(__file__).parent / "fixtures" / "outreach" / name
-
-
-def _load_fixture(name: str) -> str:
-    return _fixture_path(name).read_text(encoding="utf-8")
-
-
-def _fake_site_mapping() -> Dict[str, str]:
-    return {
-        "/": _load_fixture("site_root.html"),
-        "/cennik": _load_fixture("cennik.html"),
-        "/kontakt": _load_fixture("kontakt.html"),
-        "/kontakt/wyslij": _load_fixture("kontakt.html"),
-        "/about": "<html><body>O nas</body></html>",
-    }
+import pytest
 
-
-def _fake_fetcher(url: str) -> FetchResult:
-    mapping = _fake_site_mapping()
-    parsed = urlparse(url)
-    path = parsed.path or "/"
-    html = mapping.get(path)
-    if html is None:
-        return FetchResult(
-            url=url,
-            final_url=url,
-            status_code=404,
-            content_type="text/html",
-            text="",
-            error="not_found",
-            from_cache=False,
-        )
-    return FetchResult(
-        url=url,
-        final_url=url,
-        status_code=200,
-        content_type="text/html",
-        text=html,
-        error=None,
-        from_cache=False,
-    )
-
-
-class FakeGeminiClient(BaseGeminiClient):
-    def generate_json(self, prompt_name, prompt_text, prompt_hash, validator=None):
-        if prompt_name == "gemini_price_calc_v3.txt":
-            data = {
-                "clinic_name": "Clinic Test",
-                "currency": "PLN",
-                "evidence_level": "strong",
-                "extracted_prices": [
-                    {
-                        "key": "bonding_metal_1_arch",
-                        "label": "Aparat stały metalowy 1 łuk",
-                        "amount": 2800,
-                        "source": "explicit",
-                        "notes": "z cennika",
-                    }
-                ],
-                "variants": {
-                    "A": {
-                        "total": 7000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 2800,
-                            "controls": 3080,
-                            "debonding": 0,
-                            "retention": 670,
-                        },
-                        "missing": ["debond 1 arch"],
-                        "missing_items_count": 1,
-                        "fallback_items_count": 2,
-                        "fallback_total_pln": 1120,
-                        "fallback_share_pct": 16,
-                        "confidence": "medium",
-                        "assumptions": ["fallback debonding"],
-                    },
-                    "B": {
-                        "total": 14000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 5600,
-                            "controls": 6300,
-                            "debonding": 0,
-                            "retention": 1650,
-                        },
-                        "missing": ["debond 1 arch", "fixed retainer 1 arch"],
-                        "missing_items_count": 2,
-                        "fallback_items_count": 3,
-                        "fallback_total_pln": 1950,
-                        "fallback_share_pct": 14,
-                        "confidence": "medium",
-                        "assumptions": [],
-                    },
-                    "C": {
-                        "total": 15000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 5600,
-                            "controls": 7000,
-                            "debonding": 0,
-                            "retention": 1950,
-                        },
-                        "missing": ["debond 1 arch"],
-                        "missing_items_count": 1,
-                        "fallback_items_count": 3,
-                        "fallback_total_pln": 1950,
-                        "fallback_share_pct": 13,
-                        "confidence": "medium",
-                        "assumptions": [],
-                    },
-                },
-                "notes": ["deterministic fake"],
-            }
-        else:
-            data = {
-                "clinic_name": "Clinic Test",
-                "subject": "Prośba o brakujące informacje cenowe",
-                "body": "Dzień dobry, proszę o brakujące ceny.",
-                "questions_missing_prices": ["debond 1 arch"],
-                "template_preservation_check": {
-                    "preserved_phrase_1": True,
-                    "preserved_phrase_2": True,
-                },
-            }
-
-        if validator is not None:
-            validator(data)
-        return GeminiCallResult(
-            status="ok",
-            raw_text=json.dumps(data, ensure_ascii=False),
-            data=data,
-            model="fake",
-            prompt_name=prompt_name,
-            prompt_hash=prompt_hash,
-            error=None,
-        )
+from src.outreach.pipeline_outreach import run_outreach
 
 
 class FakeGmailSender:
@@ -215,10 +74,6 @@ class FakeGmailSender:
         }
 
 
-def _template_path() -> Path:
-    return Path("prompts/email_template_no_pricing_pl.txt").resolve()
-
-
 def _write_csv(path: Path) -> None:
     rows = [
         ("id-1", "Clinic One", "100"),
@@ -226,32 +81,42 @@ def _write_csv(path: Path) -> None:
         ("id-3", "Clinic Two", "98"),
     ]
     with path.open("w", encoding="utf-8", newline="") as f:
-        f.write("place_id,name,quality,rating,user_rating_count,website\n")
-        for place_id, name, quality in rows:
-            f.write(
-                ",".join([place_id, name, quality, "5.0", "200", "http://clinic.test/"])
-                + "\n"
-            )
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(("place_id", "name", "quality", "rating", "user_rating_count", "website"))
+        writer.writerows(
+            (place_id, name, quality, "5.0", "200", "http://clinic.test/")
+            for place_id, name, quality in rows
+        )
+
 
+@pytest.fixture(scope="module")
+def input_csv(tmp_path_factory) -> Path:
+    # run_outreach only reads the input CSV, so every test can share one copy.
+    path = tmp_path_factory.mktemp("csv") / "input.csv"
+    _write_csv(path)
+    return path
 
-def test_gmail_send_disabled_by_default(tmp_path: Path):
-    csv_path = tmp_path / "input.csv"
-    _write_csv(csv_path)
-    template_path = _template_path()
-    assert template_path.exists()
 
+def test_gmail_send_disabled_by_default(
+    tmp_path: Path,
+    input_csv: Path,
+    outreach_template_path: Path,
+    fake_outreach_fetcher,
+    fake_gemini,
+):
     fake_gmail = FakeGmailSender()
     out_dir = tmp_path / "outreach_default"
     result = run_outreach(
-        input_csv_path=str(csv_path),
+        input_csv_path=str(input_csv),
         out_dir=out_dir,
         top_n=3,
         max_pages=10,
         refresh_web=True,
-        fetcher=_fake_fetcher,
-        gemini_client=FakeGeminiClient(),
-        template_path=template_path,
+        fetcher=fake_outreach_fetcher,
+        gemini_client=fake_gemini,
+        template_path=outreach_template_path,
         gmail_sender=fake_gmail,
+        gmail_send_log_path=tmp_path / "send_log.jsonl",
     )
 
     assert fake_gmail.draft_calls == []
@@ -259,23 +124,24 @@ def test_gmail_send_disabled_by_default(tmp_path: Path):
     assert not (result.run_dir / "outreach_gmail_report.txt").exists()
 
 
-def test_gmail_drafts_mode_creates_drafts_and_respects_limit(tmp_path: Path):
-    csv_path = tmp_path / "input.csv"
-    _write_csv(csv_path)
-    template_path = _template_path()
-    assert template_path.exists()
-
+def test_gmail_drafts_mode_creates_drafts_and_respects_limit(
+    tmp_path: Path,
+    input_csv: Path,
+    outreach_template_path: Path,
+    fake_outreach_fetcher,
+    fake_gemini,
+):
     fake_gmail = FakeGmailSender()
     out_dir = tmp_path / "outreach_drafts"
     result = run_outreach(
-        input_csv_path=str(csv_path),
+        input_csv_path=str(input_csv),
         out_dir=out_dir,
         top_n=3,
         max_pages=10,
         refresh_web=True,
-        fetcher=_fake_fetcher,
-        gemini_client=FakeGeminiClient(),
-        template_path=template_path,
+        fetcher=fake_outreach_fetcher,
+        gemini_client=fake_gemini,
+        template_path=outreach_template_path,
         gmail_drafts=True,
         gmail_max_drafts=1,
         gmail_sender=fake_gmail,
@@ -293,22 +159,23 @@ def test_gmail_drafts_mode_creates_drafts_and_respects_limit(tmp_path: Path):
     assert by_name["Clinic Two"]["gmail_draft"]["status"] == "blocked_max_drafts"
 
 
-def test_gmail_send_requires_ack_and_non_dry_run(tmp_path: Path):
-    csv_path = tmp_path / "input.csv"
-    _write_csv(csv_path)
-    template_path = _template_path()
-    assert template_path.exists()
-
+def test_gmail_send_requires_ack_and_non_dry_run(
+    tmp_path: Path,
+    input_csv: Path,
+    outreach_template_path: Path,
+    fake_outreach_fetcher,
+    fake_gemini,
+):
     fake_gmail = FakeGmailSender()
     out_dir = tmp_path / "outreach_send_blocked"
     result = run_outreach(
-        input_csv_path=str(csv_path),
+        input_csv_path=str(input_csv),
         out_dir=out_dir,
         top_n=3,
         max_pages=10,
-        fetcher=_fake_fetcher,
-        gemini_client=FakeGeminiClient(),
-        template_path=template_path,
+        fetcher=fake_outreach_fetcher,
+        gemini_client=fake_gemini,
+        template_path=outreach_template_path,
         gmail_send=True,
         gmail_send_ack=False,
         gmail_send_dry_run=False,
@@ -325,12 +192,13 @@ def test_gmail_send_requires_ack_and_non_dry_run(tmp_path: Path):
     assert "blocked_ack_required" in gmail_statuses
 
 
-def test_gmail_send_calls_sender_when_allowed_and_respects_dedupe_and_limits(tmp_path: Path):
-    csv_path = tmp_path / "input.csv"
-    _write_csv(csv_path)
-    template_path = _template_path()
-    assert template_path.exists()
-
+def test_gmail_send_calls_sender_when_allowed_and_respects_dedupe_and_limits(
+    tmp_path: Path,
+    input_csv: Path,
+    outreach_template_path: Path,
+    fake_outreach_fetcher,
+    fake_gemini,
+):
     send_log_path = tmp_path / "send_log.jsonl"
     send_log_path.write_text(
         json.dumps(
@@ -350,14 +218,14 @@ def test_gmail_send_calls_sender_when_allowed_and_respects_dedupe_and_limits(tmp
     fake_gmail = FakeGmailSender()
     out_dir = tmp_path / "outreach_send_ok"
     result = run_outreach(
-        input_csv_path=str(csv_path),
+        input_csv_path=str(input_csv),
         out_dir=out_dir,
         top_n=3,
         max_pages=10,
         outreach_force=True,
-        fetcher=_fake_fetcher,
-        gemini_client=FakeGeminiClient(),
-        template_path=template_path,
+        fetcher=fake_outreach_fetcher,
+        gemini_client=fake_gemini,
+        template_path=outreach_template_path,
         gmail_send=True,
         gmail_send_ack=True,
         gmail_send_dry_run=False,
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from src.gemini_client import BaseGeminiClient, GeminiCallResult
 from src.outreach.pipeline_outreach import run_outreach
 
@@ -36,7 +38,9 @@ def _write_template(path: Path) -> None:
     )
 
 
-def test_missing_website_skips_gemini_calls(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def missing_website_run(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("missing_website")
     input_path = tmp_path / "results.json"
     input_rows = [
         {
@@ -48,7 +52,7 @@ def test_missing_website_skips_gemini_calls(tmp_path: Path) -> None:
             "user_rating_count": "200",
         }
     ]
-    input_path.write_text(json.dumps(input_rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    input_path.write_text(json.dumps(input_rows, ensure_ascii=False), encoding="utf-8")
 
     template_path = tmp_path / "email_template_no_pricing_pl.txt"
     _write_template(template_path)
@@ -63,11 +67,17 @@ def test_missing_website_skips_gemini_calls(tmp_path: Path) -> None:
         gemini_client=gemini,
         template_path=template_path,
     )
+    payload = json.loads(result.results_path.read_text(encoding="utf-8"))
+    return gemini, payload[0]
+
 
+def test_missing_website_skips_gemini_calls(missing_website_run) -> None:
+    gemini, _ = missing_website_run
     assert gemini.call_count == 0
 
-    payload = json.loads(result.results_path.read_text(encoding="utf-8"))
-    row = payload[0]
+
+def test_missing_website_row_records_skipped_gemini_steps(missing_website_run) -> None:
+    _, row = missing_website_run
     assert row["needs_manual_search"] is True
     assert row["gemini_status"]["price_calc"] == "skipped_missing_website"
     assert row["gemini_status"]["outreach"] == "skipped_missing_website"
@@ -1,37 +1,56 @@
+import csv
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 from urllib.parse import urlparse
 
-from src.gemini_client import BaseGeminiClient, GeminiCallResult
+import pytest
+
 from src.outreach.crawler import DomainLimitedCrawler, FetchResult
 from src.outreach.extractors import extract_emails, extract_links_forms_emails_pdfs
 from src.outreach.pipeline_outreach import run_outreach
 
 
+_FIXTURES_DIR = (Path(__file__).parent / "fixtures" / "outreach").resolve()
+
+
 def _fixture_path(name: str) -> Path:
-    return Path(__file__).parent / "fixtures" / "outreach" / name
+    return _FIXTURES_DIR / name
 
 
+@lru_cache(maxsize=None)
 def _load_fixture(name: str) -> str:
     return _fixture_path(name).read_text(encoding="utf-8")
 
 
-def _fake_site_mapping() -> Dict[str, str]:
-    return {
+_SITE_MAP: Mapping[str, str] = MappingProxyType(
+    {
         "/": _load_fixture("site_root.html"),
         "/cennik": _load_fixture("cennik.html"),
         "/kontakt": _load_fixture("kontakt.html"),
         "/kontakt/wyslij": _load_fixture("kontakt.html"),
         "/about": "<html><body>O nas</body></html>",
     }
+)
+
+
+# Exact URLs the crawler asks for on the fake host; other hosts fall back to a path lookup.
+_URL_TO_HTML: Mapping[str, str] = MappingProxyType(
+    {
+        "http://clinic.test": _SITE_MAP["/"],
+        **{"http://clinic.test" + path: html for path, html in _SITE_MAP.items()},
+    }
+)
 
 
+# FetchResult is frozen and fully determined by the URL, so repeat fetches share one instance.
+@lru_cache(maxsize=256)
 def _fake_fetcher(url: str) -> FetchResult:
-    mapping = _fake_site_mapping()
-    parsed = urlparse(url)
-    path = parsed.path or "/"
-    html = mapping.get(path)
+    html = _URL_TO_HTML.get(url)
+    if html is None:
+        html = _SITE_MAP.get(urlparse(url).path or "/")
     if html is None:
         return FetchResult(
             url=url,
@@ -53,102 +72,6 @@ def _fake_fetcher(url: str) -> FetchResult:
     )
 
 
-class FakeGeminiClient(BaseGeminiClient):
-    def generate_json(self, prompt_name, prompt_text, prompt_hash, validator=None):
-        if prompt_name == "gemini_price_calc_v3.txt":
-            data = {
-                "clinic_name": "Clinic Test",
-                "currency": "PLN",
-                "evidence_level": "strong",
-                "extracted_prices": [
-                    {
-                        "key": "bonding_metal_1_arch",
-                        "label": "Aparat stały metalowy 1 łuk",
-                        "amount": 2800,
-                        "source": "explicit",
-                        "notes": "z cennika",
-                    }
-                ],
-                "variants": {
-                    "A": {
-                        "total": 7000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 2800,
-                            "controls": 3080,
-                            "debonding": 0,
-                            "retention": 670,
-                        },
-                        "missing": ["debond 1 arch"],
-                        "missing_items_count": 1,
-                        "fallback_items_count": 2,
-                        "fallback_total_pln": 1120,
-                        "fallback_share_pct": 16,
-                        "confidence": "medium",
-                        "assumptions": ["fallback debonding"],
-                    },
-                    "B": {
-                        "total": 14000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 5600,
-                            "controls": 6300,
-                            "debonding": 0,
-                            "retention": 1650,
-                        },
-                        "missing": ["debond 1 arch", "fixed retainer 1 arch"],
-                        "missing_items_count": 2,
-                        "fallback_items_count": 3,
-                        "fallback_total_pln": 1950,
-                        "fallback_share_pct": 14,
-                        "confidence": "medium",
-                        "assumptions": [],
-                    },
-                    "C": {
-                        "total": 15000,
-                        "breakdown": {
-                            "start": 450,
-                            "bonding": 5600,
-                            "controls": 7000,
-                            "debonding": 0,
-                            "retention": 1950,
-                        },
-                        "missing": ["debond 1 arch"],
-                        "missing_items_count": 1,
-                        "fallback_items_count": 3,
-                        "fallback_total_pln": 1950,
-                        "fallback_share_pct": 13,
-                        "confidence": "medium",
-                        "assumptions": [],
-                    },
-                },
-                "notes": ["deterministic fake"],
-            }
-        else:
-            data = {
-                "clinic_name": "Clinic Test",
-                "subject": "Prośba o brakujące informacje cenowe",
-                "body": "Dzień dobry, proszę o brakujące ceny.",
-                "questions_missing_prices": ["debond 1 arch"],
-                "template_preservation_check": {
-                    "preserved_phrase_1": True,
-                    "preserved_phrase_2": True,
-                },
-            }
-
-        if validator is not None:
-            validator(data)
-        return GeminiCallResult(
-            status="ok",
-            raw_text=json.dumps(data, ensure_ascii=False),
-            data=data,
-            model="fake",
-            prompt_name=prompt_name,
-            prompt_hash=prompt_hash,
-            error=None,
-        )
-
-
 def test_domain_limited_crawler_stays_on_domain(tmp_path: Path):
     evidence_dir = tmp_path / "pages"
     crawler = DomainLimitedCrawler(max_pages=5, refresh_web=True, cache=None)
@@ -159,7 +82,7 @@ def test_domain_limited_crawler_stays_on_domain(tmp_path: Path):
     assert "http://clinic.test/cennik" in visited
     assert all("external.test" not in url for url in visited)
     assert any(p.final_url.endswith("/cennik") for p in result.pages)
-    assert any(evidence_dir.iterdir())
+    assert next(evidence_dir.iterdir(), None) is not None
 
 
 def test_extractors_find_emails_and_forms():
@@ -177,7 +100,10 @@ def test_extractors_find_emails_and_forms():
     assert "kontakt@clinic.test" in emails
 
 
-def test_outreach_pipeline_with_fixtures(tmp_path: Path):
+@pytest.fixture(scope="module")
+def outreach_result(tmp_path_factory, fake_gemini):
+    # One end-to-end run shared by the assertion tests below.
+    tmp_path = tmp_path_factory.mktemp("outreach")
     csv_path = tmp_path / "input.csv"
     rows = [
         {
@@ -207,22 +133,13 @@ def test_outreach_pipeline_with_fixtures(tmp_path: Path):
     ]
 
     with csv_path.open("w", encoding="utf-8", newline="") as f:
-        f.write(
-            "place_id,name,quality,rating,user_rating_count,website\n"
-            + "\n".join(
-                ",".join(
-                    [
-                        row["place_id"],
-                        row["name"],
-                        row["quality"],
-                        row["rating"],
-                        row["user_rating_count"],
-                        row["website"],
-                    ]
-                )
-                for row in rows
-            )
+        writer = csv.DictWriter(
+            f,
+            fieldnames=["place_id", "name", "quality", "rating", "user_rating_count", "website"],
+            lineterminator="\n",
         )
+        writer.writeheader()
+        writer.writerows(rows)
 
     template_path = tmp_path / "email_template_no_pricing_pl.txt"
     template_path.write_text(
@@ -250,38 +167,50 @@ Z góry dziękuję i pozdrawiam"
     )
 
     out_dir = tmp_path / "outreach"
-    result = run_outreach(
+    return run_outreach(
         input_csv_path=str(csv_path),
         out_dir=out_dir,
         top_n=3,
         max_pages=10,
         refresh_web=True,
         fetcher=_fake_fetcher,
-        gemini_client=FakeGeminiClient(),
+        gemini_client=fake_gemini,
         template_path=template_path,
     )
 
-    assert result.results_path.exists()
-    assert result.queue_path.exists()
-    assert result.summary_path.exists()
 
-    results_payload = json.loads(result.results_path.read_text(encoding="utf-8"))
-    by_name = {row["clinic_name"]: row for row in results_payload}
+@pytest.fixture(scope="module")
+def outreach_by_name(outreach_result):
+    payload = json.loads(outreach_result.results_path.read_text(encoding="utf-8"))
+    return {row["clinic_name"]: row for row in payload}
 
-    assert by_name["DeClinic"]["status"] == "skipped_do_not_contact"
-    assert by_name["No Website Clinic"]["needs_manual_search"] is True
 
-    clinic = by_name["Clinic Test"]
+@pytest.fixture(scope="module")
+def outreach_queue_by_name(outreach_result):
+    with outreach_result.queue_path.open("r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    return {row["clinic_name"]: row for row in rows}
+
+
+def test_outreach_pipeline_writes_outputs(outreach_result):
+    assert outreach_result.results_path.exists()
+    assert outreach_result.queue_path.exists()
+    assert outreach_result.summary_path.exists()
+
+
+def test_outreach_pipeline_skips_do_not_contact(outreach_by_name, outreach_queue_by_name):
+    assert outreach_by_name["DeClinic"]["status"] == "skipped_do_not_contact"
+    assert outreach_queue_by_name["DeClinic"]["status"] == "skipped_do_not_contact"
+
+
+def test_outreach_pipeline_flags_missing_website_for_manual_search(outreach_by_name, outreach_queue_by_name):
+    assert outreach_by_name["No Website Clinic"]["needs_manual_search"] is True
+    assert outreach_queue_by_name["No Website Clinic"]["status"] == "manual_needed"
+
+
+def test_outreach_pipeline_marks_crawled_clinic_ready(outreach_by_name, outreach_queue_by_name):
+    clinic = outreach_by_name["Clinic Test"]
     assert clinic["needs_manual_search"] is False
     assert clinic["pricing"]["pricing_status"] in {"partial", "html_text"}
     assert "kontakt@clinic.test" in clinic["discovered"]["emails"]
-
-    queue_rows = [
-        json.loads(line)
-        for line in result.queue_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-    queue_by_name = {row["clinic_name"]: row for row in queue_rows}
-    assert queue_by_name["DeClinic"]["status"] == "skipped_do_not_contact"
-    assert queue_by_name["No Website Clinic"]["status"] == "manual_needed"
-    assert queue_by_name["Clinic Test"]["status"] == "ready_to_email"
+    assert outreach_queue_by_name["Clinic Test"]["status"] == "ready_to_email"
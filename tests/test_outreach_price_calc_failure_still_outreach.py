@@ -1,8 +1,11 @@
 import json
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 from urllib.parse import urlparse
 
+import pytest
+
 from src.gemini_client import BaseGeminiClient, GeminiCallResult
 from src.outreach.crawler import FetchResult
 from src.outreach.pipeline_outreach import run_outreach
@@ -38,8 +41,8 @@ class PriceCalcErrorGeminiClient(BaseGeminiClient):
         )
 
 
-def _site_mapping() -> Dict[str, str]:
-    return {
+_SITE_MAP: Mapping[str, str] = MappingProxyType(
+    {
         "/": """
             <html><body>
               <a href="/cennik">Cennik</a>
@@ -61,13 +64,11 @@ def _site_mapping() -> Dict[str, str]:
         """,
         "/kontakt/wyslij": "<html><body><form></form></body></html>",
     }
+)
 
 
 def _fake_fetcher(url: str) -> FetchResult:
-    mapping = _site_mapping()
-    parsed = urlparse(url)
-    path = parsed.path or "/"
-    html = mapping.get(path)
+    html = _SITE_MAP.get(urlparse(url).path or "/")
     if html is None:
         return FetchResult(
             url=url,
@@ -89,10 +90,6 @@ def _fake_fetcher(url: str) -> FetchResult:
     )
 
 
-def _template_path() -> Path:
-    return Path("prompts/email_template_no_pricing_pl.txt").resolve()
-
-
 def _write_input(path: Path) -> None:
     rows = [
         {
@@ -104,16 +101,15 @@ def _write_input(path: Path) -> None:
             "website": "http://clinic.test/",
         }
     ]
-    path.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
 
 
-def test_price_calc_error_still_generates_outreach_message(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def price_calc_error_run(tmp_path_factory, outreach_template_path: Path):
+    tmp_path = tmp_path_factory.mktemp("price_calc_error")
     input_path = tmp_path / "results.json"
     _write_input(input_path)
 
-    template_path = _template_path()
-    assert template_path.exists()
-
     gemini = PriceCalcErrorGeminiClient()
     result = run_outreach(
         input_csv_path=str(input_path),
@@ -123,14 +119,20 @@ def test_price_calc_error_still_generates_outreach_message(tmp_path: Path) -> No
         refresh_web=True,
         fetcher=_fake_fetcher,
         gemini_client=gemini,
-        template_path=template_path,
+        template_path=outreach_template_path,
     )
+    payload = json.loads(result.results_path.read_text(encoding="utf-8"))
+    return gemini, payload[0]
+
 
+def test_price_calc_error_skips_gemini_outreach_call(price_calc_error_run) -> None:
+    gemini, _ = price_calc_error_run
     assert gemini.price_calc_calls == 1
     assert gemini.outreach_calls == 0
 
-    payload = json.loads(result.results_path.read_text(encoding="utf-8"))
-    row = payload[0]
+
+def test_price_calc_error_still_generates_outreach_message(price_calc_error_run) -> None:
+    _, row = price_calc_error_run
     assert row["gemini_status"]["price_calc"] == "http_error"
     assert row["gemini_status"]["outreach"] == "template"
     assert row["suggested_action"]["status"] == "ready_to_email"
@@ -26,3 +26,5 @@ def test_parse_routes_duration_variants():
     assert parse_routes_duration({"routes": [{"duration": "123s"}]}) == 123
     assert parse_routes_duration({"routes": [{"duration": 456}]}) == 456
     assert parse_routes_duration({"routes": []}) is None
+    assert parse_routes_duration({"routes": [{"duration": "12.7s"}]}) == 12
+    assert parse_routes_duration({"routes": [{"duration": "bogus"}]}) is None
@@ -1,6 +1,3 @@
-import json
-from pathlib import Path
-
 import pytest
 
 from src import config
@@ -24,6 +21,7 @@ class FakePlacesClient:
         self.simulate_cache = simulate_cache
         self.pages_per_call = pages_per_call
         self.metrics = metrics
+        self._parsed = None
 
     def set_budget(self, budget):
         self.budget = budget
@@ -43,12 +41,15 @@ class FakePlacesClient:
                 self.budget.consume("places")
         elif self.simulate_cache and self.metrics:
             self.metrics.inc_cache_hit("places")
-        return parse_places_response(self.places_fixture)
+        if self._parsed is None:
+            self._parsed = parse_places_response(self.places_fixture)
+        return self._parsed
 
 
 class FakeRoutesClient:
     def __init__(self, routes_fixture, budget=None, simulate_live: bool = False, simulate_cache: bool = False, metrics=None):
         self.routes_fixture = routes_fixture
+        self._durations = routes_fixture.get("durations", {})
         self.budget = budget
         self.simulate_live = simulate_live
         self.simulate_cache = simulate_cache
@@ -66,66 +67,59 @@ class FakeRoutesClient:
         elif self.simulate_cache and self.metrics:
             self.metrics.inc_cache_hit("routes")
         key = f"{origin_id}|{destination['place_id']}"
-        return self.routes_fixture.get("durations", {}).get(key)
-
-
-def load_fixture(name):
-    path = Path(__file__).parent / "fixtures" / name
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-@pytest.fixture(autouse=True)
-def patch_config(monkeypatch):
-    monkeypatch.setattr(
-        config,
-        "HUBS",
-        {
-            "galeria_polnocna": {"name": "Galeria Północna", "lat": 52.30, "lon": 20.95},
-            "alk": {"name": "ALK", "lat": 52.25, "lon": 21.00},
-            "centralny": {"name": "Central", "lat": 52.23, "lon": 21.01},
-        },
-    )
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", [])
-    monkeypatch.setattr(config, "COVERAGE_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "WARSAW_BBOX", {"lat_min": 52.1, "lat_max": 52.3, "lon_min": 20.9, "lon_max": 21.1})
-    monkeypatch.setattr(config, "COVERAGE_CONFIG", config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0))
-    monkeypatch.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-
-
-def test_pipeline_offline_stable():
-    places_fixture = load_fixture("places_text_search.json")
-    routes_fixture = load_fixture("routes_compute_routes.json")
-
+        return self._durations.get(key)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_config():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            config,
+            "HUBS",
+            {
+                "galeria_polnocna": {"name": "Galeria Północna", "lat": 52.30, "lon": 20.95},
+                "alk": {"name": "ALK", "lat": 52.25, "lon": 21.00},
+                "centralny": {"name": "Central", "lat": 52.23, "lon": 21.01},
+            },
+        )
+        mp.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
+        mp.setattr(config, "GENERAL_QUERIES", [])
+        mp.setattr(config, "COVERAGE_QUERIES", ["ortodonta"])
+        mp.setattr(config, "WARSAW_BBOX", {"lat_min": 52.1, "lat_max": 52.3, "lon_min": 20.9, "lon_max": 21.1})
+        mp.setattr(config, "COVERAGE_CONFIG", config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0))
+        mp.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
+        mp.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
+        yield
+
+
+# Offline run settings shared by every pipeline run in this module.
+_RUN_KWARGS = {
+    "api_key": None,
+    "cache_db_path": ":memory:",
+    "no_cache": True,
+    "refresh_routes": True,
+    "top_n": 10,
+    "output_dir": "out",
+    "write_outputs": False,
+}
+
+
+def test_pipeline_offline_stable(places_fixture, routes_fixture):
     fake_places = FakePlacesClient(places_fixture)
     fake_routes = FakeRoutesClient(routes_fixture)
 
     result1 = run(
-        api_key=None,
-        cache_db_path=":memory:",
+        **_RUN_KWARGS,
         max_places=100,
         max_routes=100,
-        no_cache=True,
-        refresh_routes=True,
-        top_n=10,
-        output_dir="out",
-        write_outputs=False,
         places_client=fake_places,
         routes_client=fake_routes,
     )
 
     result2 = run(
-        api_key=None,
-        cache_db_path=":memory:",
+        **_RUN_KWARGS,
         max_places=100,
         max_routes=100,
-        no_cache=True,
-        refresh_routes=True,
-        top_n=10,
-        output_dir="out",
-        write_outputs=False,
         places_client=fake_places,
         routes_client=fake_routes,
     )
@@ -143,33 +137,24 @@ def test_pipeline_offline_stable():
         assert required_keys.issubset(row)
 
     finals = [row["final"] for row in results]
-    assert all(a >= b for a, b in zip(finals, finals[1:]))
+    assert finals == sorted(finals, reverse=True)
 
     sort_keys = [result_sort_key(row) for row in results]
     assert all(a <= b for a, b in zip(sort_keys, sort_keys[1:]))
 
-    for prev, curr in zip(results, results[1:]):
-        if prev["final"] == curr["final"]:
-            assert result_sort_key(prev)[1:] <= result_sort_key(curr)[1:]
+    for i in range(1, len(results)):
+        if finals[i - 1] == finals[i]:
+            assert sort_keys[i - 1][1:] <= sort_keys[i][1:]
 
 
-def test_offline_request_counters_increment_when_simulating_live():
-    places_fixture = load_fixture("places_text_search.json")
-    routes_fixture = load_fixture("routes_compute_routes.json")
-
+def test_offline_request_counters_increment_when_simulating_live(places_fixture, routes_fixture):
     fake_places = FakePlacesClient(places_fixture, simulate_live=True)
     fake_routes = FakeRoutesClient(routes_fixture, simulate_live=True)
 
     result = run(
-        api_key=None,
-        cache_db_path=":memory:",
+        **_RUN_KWARGS,
         max_places=200,
         max_routes=200,
-        no_cache=True,
-        refresh_routes=True,
-        top_n=10,
-        output_dir="out",
-        write_outputs=False,
         places_client=fake_places,
         routes_client=fake_routes,
     )
@@ -178,23 +163,14 @@ def test_offline_request_counters_increment_when_simulating_live():
     assert result.summary["routes_requests"] > 0
 
 
-def test_summary_reports_requests_after_transit_and_coverage_off():
-    places_fixture = load_fixture("places_text_search.json")
-    routes_fixture = load_fixture("routes_compute_routes.json")
-
+def test_summary_reports_requests_after_transit_and_coverage_off(places_fixture, routes_fixture):
     fake_places = FakePlacesClient(places_fixture, simulate_live=True)
     fake_routes = FakeRoutesClient(routes_fixture, simulate_live=True)
 
     result = run(
-        api_key=None,
-        cache_db_path=":memory:",
+        **_RUN_KWARGS,
         max_places=200,
         max_routes=200,
-        no_cache=True,
-        refresh_routes=True,
-        top_n=10,
-        output_dir="out",
-        write_outputs=False,
         places_client=fake_places,
         routes_client=fake_routes,
         coverage_mode="off",
@@ -210,23 +186,14 @@ def test_summary_reports_requests_after_transit_and_coverage_off():
     assert not any(line.startswith("Coverage: U_hubs") for line in lines)
 
 
-def test_offline_cache_hits_reported_when_simulating_cache():
-    places_fixture = load_fixture("places_text_search.json")
-    routes_fixture = load_fixture("routes_compute_routes.json")
-
+def test_offline_cache_hits_reported_when_simulating_cache(places_fixture, routes_fixture):
     fake_places = FakePlacesClient(places_fixture, simulate_cache=True)
     fake_routes = FakeRoutesClient(routes_fixture, simulate_cache=True)
 
     result = run(
-        api_key=None,
-        cache_db_path=":memory:",
+        **_RUN_KWARGS,
         max_places=200,
         max_routes=200,
-        no_cache=True,
-        refresh_routes=True,
-        top_n=10,
-        output_dir="out",
-        write_outputs=False,
         places_client=fake_places,
         routes_client=fake_routes,
     )
@@ -27,7 +27,8 @@ def _place(place_id: str, name: str | None = None) -> Place:
 
 class ScenarioPlacesClient:
     def __init__(self, mapping: Dict[Key, List[Place]]):
-        self.mapping = mapping
+        # The pipeline only iterates search results, so each scenario hands out one shared tuple.
+        self.mapping = {key: tuple(places) for key, places in mapping.items()}
         self.calls: List[Dict[str, object]] = []
 
     def set_budget(self, budget):  # pragma: no cover - interface hook
@@ -48,7 +49,7 @@ class ScenarioPlacesClient:
                 "max_pages": max_pages,
             }
         )
-        return list(self.mapping.get((query, point_kind), []))
+        return self.mapping.get((query, point_kind), ())
 
 
 class DummyRoutesClient:
@@ -62,29 +63,34 @@ class DummyRoutesClient:
         return None
 
 
-def _patch_base_config(monkeypatch):
-    monkeypatch.setattr(
-        config,
-        "HUBS",
-        {
-            "hub1": {"name": "Hub 1", "lat": 52.23, "lon": 21.01},
-        },
-    )
-    monkeypatch.setattr(
-        config,
-        "WARSAW_BBOX",
-        {"lat_min": 52.2, "lat_max": 52.24, "lon_min": 21.0, "lon_max": 21.04},
-    )
-    monkeypatch.setattr(
-        config,
-        "COVERAGE_CONFIG",
-        config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0, uplift_threshold=0.0),
-    )
-    monkeypatch.setattr(config, "COVERAGE_MAX_PAGES_PER_QUERY", 1)
-    monkeypatch.setattr(config, "COVERAGE_QUERIES", [])
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-    monkeypatch.setattr(config, "PLACES_MAX_PAGES_PER_QUERY", 1)
-    monkeypatch.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
+@pytest.fixture(scope="module", autouse=True)
+def base_config():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            config,
+            "HUBS",
+            {
+                "hub1": {"name": "Hub 1", "lat": 52.23, "lon": 21.01},
+            },
+        )
+        mp.setattr(
+            config,
+            "WARSAW_BBOX",
+            {"lat_min": 52.2, "lat_max": 52.24, "lon_min": 21.0, "lon_max": 21.04},
+        )
+        mp.setattr(
+            config,
+            "COVERAGE_CONFIG",
+            config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0, uplift_threshold=0.0),
+        )
+        mp.setattr(config, "COVERAGE_MAX_PAGES_PER_QUERY", 1)
+        mp.setattr(config, "COVERAGE_QUERIES", [])
+        mp.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
+        mp.setattr(config, "PLACES_MAX_PAGES_PER_QUERY", 1)
+        mp.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
+        mp.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
+        mp.setattr(config, "GENERAL_QUERIES", ["stomatolog", "dentist"])
+        yield
 
 
 def _run_with_clients(places_client: ScenarioPlacesClient, coverage_mode: str = "off"):
@@ -106,9 +112,6 @@ def _run_with_clients(places_client: ScenarioPlacesClient, coverage_mode: str =
 
 
 def test_general_queries_skipped_when_ortho_candidates_sufficient(monkeypatch):
-    _patch_base_config(monkeypatch)
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", ["stomatolog", "dentist"])
     monkeypatch.setattr(config, "MIN_CANDIDATES", 2)
 
     mapping: Dict[Key, List[Place]] = {
@@ -123,9 +126,6 @@ def test_general_queries_skipped_when_ortho_candidates_sufficient(monkeypatch):
 
 
 def test_general_queries_run_when_ortho_candidates_insufficient(monkeypatch):
-    _patch_base_config(monkeypatch)
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", ["stomatolog", "dentist"])
     monkeypatch.setattr(config, "MIN_CANDIDATES", 3)
 
     mapping: Dict[Key, List[Place]] = {
@@ -145,9 +145,6 @@ def test_general_queries_run_when_ortho_candidates_insufficient(monkeypatch):
 
 
 def test_general_query_cost_controls_allow_grid_only_when_still_insufficient(monkeypatch):
-    _patch_base_config(monkeypatch)
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", ["stomatolog", "dentist"])
     monkeypatch.setattr(config, "MIN_CANDIDATES", 3)
 
     mapping: Dict[Key, List[Place]] = {
@@ -1,5 +1,5 @@
 from src.geo import haversine_km
-from src.pipeline import build_radius_scan_points
+from src.pipeline import apply_filters, apply_radius_scan_filters, build_radius_scan_points
 
 
 def test_radius_scan_points_within_radius():
@@ -29,3 +29,43 @@ def test_radius_scan_deterministic_ordering():
     points1 = build_radius_scan_points(center_lat, center_lon, radius_km, grid_step_km=2.0)
     points2 = build_radius_scan_points(center_lat, center_lon, radius_km, grid_step_km=2.0)
     assert points1 == points2
+
+
+def test_radius_scan_points_match_exact_haversine_on_grid():
+    center_lat = 52.0
+    center_lon = 21.0
+    radius_km = 7.0
+    points = build_radius_scan_points(center_lat, center_lon, radius_km, grid_step_km=0.25)
+    lats = sorted({p["lat"] for p in points})
+    lons = sorted({p["lon"] for p in points})
+    expected = [
+        (lat, lon)
+        for lat in lats
+        for lon in lons
+        if haversine_km(lat, lon, center_lat, center_lon) <= radius_km + 1e-6
+    ]
+    assert [(p["lat"], p["lon"]) for p in points] == expected
+
+
+def test_filter_distances_match_haversine():
+    hubs = [{"lat": 52.30, "lon": 20.95}, {"lat": 52.23, "lon": 21.01}]
+    coords = [(52.25, 21.0), (52.1, 21.3), (52.4, 20.8)]
+    places_by_id = {
+        f"p{i}": {
+            "place_id": f"p{i}",
+            "name": f"Clinic {i}",
+            "rating": 4.8,
+            "user_rating_count": 500,
+            "lat": lat,
+            "lon": lon,
+        }
+        for i, (lat, lon) in enumerate(coords)
+    }
+
+    apply_radius_scan_filters(places_by_id, 52.0, 21.0, radius_km=30.0)
+    apply_filters(places_by_id, hubs)
+
+    for place in places_by_id.values():
+        lat, lon = place["lat"], place["lon"]
+        assert place["distance_km_to_center"] == haversine_km(lat, lon, 52.0, 21.0)
+        assert place["distance_km"] == min(haversine_km(lat, lon, h["lat"], h["lon"]) for h in hubs)
@@ -37,7 +37,7 @@ class FakeRoutesClient:
         return None
 
 
-def test_radius_scan_outputs_and_skips_routes(tmp_path, monkeypatch):
+def test_radius_scan_outputs_and_skips_routes(tmp_path, monkeypatch, offline_query_config):
     monkeypatch.setattr(
         config,
         "HUBS",
@@ -47,10 +47,6 @@ def test_radius_scan_outputs_and_skips_routes(tmp_path, monkeypatch):
             "galeria_polnocna": {"name": "Gallery", "lat": 1.2, "lon": 1.2},
         },
     )
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", [])
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-    monkeypatch.setattr(config, "MIN_USER_RATING_COUNT", 10)
 
     places = [
         {
@@ -1,6 +1,4 @@
 import csv
-import json
-from pathlib import Path
 
 import pytest
 
@@ -9,15 +7,10 @@ from src.pipeline import run
 from src.places_client import parse_places_response
 
 
-def _load_fixture(name: str):
-    path = Path(__file__).parent / "fixtures" / name
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 class FakePlacesClient:
     def __init__(self, places_fixture):
         self.places_fixture = places_fixture
+        self._parsed = None
 
     def set_budget(self, budget):  # pragma: no cover - interface hook
         self.budget = budget
@@ -26,12 +19,15 @@ class FakePlacesClient:
         self.metrics = metrics
 
     def search_text_all(self, query, point, type_filter=None, max_pages=None):
-        return parse_places_response(self.places_fixture)
+        if self._parsed is None:
+            self._parsed = parse_places_response(self.places_fixture)
+        return self._parsed
 
 
 class FakeRoutesClient:
     def __init__(self, routes_fixture):
         self.routes_fixture = routes_fixture
+        self._durations = routes_fixture.get("durations", {})
 
     def set_budget(self, budget):  # pragma: no cover - interface hook
         self.budget = budget
@@ -41,41 +37,40 @@ class FakeRoutesClient:
 
     def compute_route_duration(self, origin_id, origin, destination, departure_time_rfc3339, mode=None):
         key = f"{origin_id}|{destination['place_id']}"
-        return self.routes_fixture.get("durations", {}).get(key)
-
-
-@pytest.fixture(autouse=True)
-def patch_config(monkeypatch):
-    monkeypatch.setattr(
-        config,
-        "HUBS",
-        {
-            "galeria_polnocna": {"name": "Galeria Północna", "lat": 52.30, "lon": 20.95},
-            "alk": {"name": "ALK", "lat": 52.25, "lon": 21.00},
-            "centralny": {"name": "Central", "lat": 52.23, "lon": 21.01},
-        },
-    )
-    monkeypatch.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(config, "GENERAL_QUERIES", [])
-    monkeypatch.setattr(config, "COVERAGE_QUERIES", ["ortodonta"])
-    monkeypatch.setattr(
-        config,
-        "WARSAW_BBOX",
-        {"lat_min": 52.1, "lat_max": 52.3, "lon_min": 20.9, "lon_max": 21.1},
-    )
-    monkeypatch.setattr(
-        config,
-        "COVERAGE_CONFIG",
-        config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0),
-    )
-    monkeypatch.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
-    monkeypatch.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
-
-
-def test_rejections_csv_written_with_headers_and_rows(tmp_path):
-    places_fixture = _load_fixture("places_text_search.json")
-    routes_fixture = _load_fixture("routes_compute_routes.json")
-
+        return self._durations.get(key)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_config():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            config,
+            "HUBS",
+            {
+                "galeria_polnocna": {"name": "Galeria Północna", "lat": 52.30, "lon": 20.95},
+                "alk": {"name": "ALK", "lat": 52.25, "lon": 21.00},
+                "centralny": {"name": "Central", "lat": 52.23, "lon": 21.01},
+            },
+        )
+        mp.setattr(config, "ORTHO_QUERIES", ["ortodonta"])
+        mp.setattr(config, "GENERAL_QUERIES", [])
+        mp.setattr(config, "COVERAGE_QUERIES", ["ortodonta"])
+        mp.setattr(
+            config,
+            "WARSAW_BBOX",
+            {"lat_min": 52.1, "lat_max": 52.3, "lon_min": 20.9, "lon_max": 21.1},
+        )
+        mp.setattr(
+            config,
+            "COVERAGE_CONFIG",
+            config.CoverageConfig(grid_size_initial=2, grid_max_iterations=0),
+        )
+        mp.setattr(config, "DEPARTURE_TIME_RFC3339_OVERRIDE", "2026-01-26T16:00:00Z")
+        mp.setattr(config, "PLACES_SUPPORTS_TYPE_FILTER", False)
+        yield
+
+
+def test_rejections_csv_written_with_headers_and_rows(tmp_path, places_fixture, routes_fixture):
     fake_places = FakePlacesClient(places_fixture)
     fake_routes = FakeRoutesClient(routes_fixture)
 
@@ -1,3 +1,8 @@
+import json
+
+import pytest
+
+from src import reporting
 from src.reporting import atomic_write_text
 
 
@@ -12,3 +17,131 @@ def test_atomic_write_text(tmp_path):
 
     leftovers = [p for p in tmp_path.iterdir() if p.name != "atomic.txt"]
     assert not leftovers
+
+
+def test_atomic_writer_non_durable_skips_fsync(tmp_path, monkeypatch):
+    fsync_calls = []
+    monkeypatch.setattr(reporting.os, "fsync", lambda fd: fsync_calls.append(fd))
+    path = tmp_path / "progress.json"
+
+    with reporting.atomic_writer(str(path), durable=False) as f:
+        f.write("{}")
+    assert path.read_text(encoding="utf-8") == "{}"
+    assert fsync_calls == []
+
+    with reporting.atomic_writer(str(path), durable=True) as f:
+        f.write("[]")
+    assert path.read_text(encoding="utf-8") == "[]"
+    assert len(fsync_calls) == 2
+
+
+def test_atomic_writer_env_opt_out_skips_fsync(tmp_path, monkeypatch):
+    fsync_calls = []
+    monkeypatch.setattr(reporting.os, "fsync", lambda fd: fsync_calls.append(fd))
+    monkeypatch.setenv("GMR_ATOMIC_OUTPUT", "0")
+    path = tmp_path / "results.csv"
+
+    with reporting.atomic_writer(str(path)) as f:
+        f.write("a,b\n")
+    assert path.read_text(encoding="utf-8") == "a,b\n"
+    assert fsync_calls == []
+
+
+def test_progress_reporter_skips_unchanged_snapshots(tmp_path, monkeypatch):
+    writes = []
+    original_writer = reporting.atomic_writer
+
+    def counting_writer(path, *args, **kwargs):
+        writes.append(path)
+        return original_writer(path, *args, **kwargs)
+
+    monkeypatch.setattr(reporting, "atomic_writer", counting_writer)
+    path = tmp_path / "progress.json"
+    progress = reporting.ProgressReporter(str(path), log_every=0, write_interval_seconds=0.0)
+
+    progress.set_stage("harvest", total_estimate=2)
+    progress.flush()
+    progress.flush()
+    assert len(writes) == 1
+
+    progress.advance()
+    progress.flush()
+    assert len(writes) == 2
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text)["processed_count"] == 1
+    assert '"processed_count":1,' in text
+
+
+def test_csv_writers_stream_generators(tmp_path):
+    empty_path = tmp_path / "empty.csv"
+    reporting.write_list_mode_results_csv(str(empty_path), (row for row in []))
+    assert empty_path.read_text(encoding="utf-8") == ""
+
+    rows = ({"place_id": f"p{i}", "name": f"Place {i}", "found_by_queries": ["q"]} for i in range(3))
+    path = tmp_path / "list_mode_results.csv"
+    reporting.write_list_mode_results_csv(str(path), rows)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("place_id,name,")
+    assert [line.split(",", 1)[0] for line in lines[1:]] == ["p0", "p1", "p2"]
+
+
+def test_background_writer_waits_for_all_writers_and_reraises(tmp_path):
+    calls = []
+
+    def fail(path):
+        raise OSError(f"disk full: {path}")
+
+    with reporting.BackgroundWriter() as writer:
+        writer.submit(reporting.write_summary, str(tmp_path / "summary.txt"), ["a", "b"])
+        writer.submit(calls.append, "second")
+    assert (tmp_path / "summary.txt").read_text(encoding="utf-8") == "a\nb"
+    assert calls == ["second"]
+
+    writer = reporting.BackgroundWriter(max_workers=2)
+    writer.submit(fail, "x.csv")
+    writer.submit(calls.append, "after")
+    writer.submit(fail, "y.csv")
+    with pytest.raises(OSError, match="x.csv"):
+        writer.join()
+    assert calls == ["second", "after"]
+    writer.join()
+
+
+def test_write_summary_skips_fsync(tmp_path, monkeypatch):
+    fsync_calls = []
+    monkeypatch.setattr(reporting.os, "fsync", lambda fd: fsync_calls.append(fd))
+    path = tmp_path / "summary.txt"
+
+    reporting.write_summary(str(path), iter(["Zażółć", "line 2"]))
+
+    assert path.read_text(encoding="utf-8") == "Zażółć\nline 2"
+    assert fsync_calls == []
+    assert [p.name for p in tmp_path.iterdir()] == ["summary.txt"]
+
+
+def test_atomic_batch_fsyncs_directory_once(tmp_path, monkeypatch):
+    dir_fsyncs = []
+    monkeypatch.setattr(reporting, "_fsync_dir", dir_fsyncs.append)
+    monkeypatch.setattr(reporting, "_is_ephemeral_dir", lambda path: False)
+    monkeypatch.delenv("GMR_ATOMIC_OUTPUT", raising=False)
+
+    with reporting.atomic_batch():
+        for name in ("a.json", "b.json", "c.json"):
+            reporting.write_json_object(str(tmp_path / name), {"name": name})
+    assert dir_fsyncs == [str(tmp_path)]
+
+    reporting.write_json_object(str(tmp_path / "d.json"), {})
+    assert dir_fsyncs == [str(tmp_path), str(tmp_path)]
+
+
+def test_background_writer_fsyncs_directory_once_across_workers(tmp_path, monkeypatch):
+    dir_fsyncs = []
+    monkeypatch.setattr(reporting, "_fsync_dir", dir_fsyncs.append)
+    monkeypatch.setattr(reporting, "_is_ephemeral_dir", lambda path: False)
+    monkeypatch.delenv("GMR_ATOMIC_OUTPUT", raising=False)
+
+    with reporting.BackgroundWriter(max_workers=3) as writer:
+        for i in range(8):
+            writer.submit(reporting.write_json_object, str(tmp_path / f"{i}.json"), {"i": i})
+    assert dir_fsyncs == [str(tmp_path)]
+    assert len(list(tmp_path.glob("*.json"))) == 8
@@ -1,5 +1,6 @@
 import json
 
+from src import reporting
 from src.reporting import write_json_object
 
 
@@ -19,3 +20,48 @@ def test_write_json_object_nested_atomic(tmp_path):
 
     leftovers = [p for p in tmp_path.iterdir() if p.name != "coverage.json"]
     assert not leftovers
+
+
+def test_compact_json_cells_keep_stdlib_format():
+    value = {"c1": 1.5, "names": ["Zółć", "b"], "none": None, 2: "int key"}
+    assert reporting._dumps_compact(value) == json.dumps(value, ensure_ascii=False)
+
+
+def test_pretty_json_keeps_stdlib_float_spelling():
+    value = {
+        "rows": [{"final": 0.75, "name": "Zółć", "types": []}],
+        "counts": {},
+        "none": None,
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "neg_inf": float("-inf"),
+        "large": 1e16,
+        "small": 1e-7,
+    }
+    text = reporting._dumps_pretty(value)
+
+    assert text == json.dumps(value, ensure_ascii=False, indent=2)
+    assert '"nan": NaN' in text
+    assert '"inf": Infinity' in text
+    assert '"neg_inf": -Infinity' in text
+    assert '"large": 1e+16' in text
+    assert '"small": 1e-07' in text
+
+
+def test_csv_json_cells_encode_each_distinct_list_once(monkeypatch):
+    calls = []
+    original = reporting._dumps_compact
+
+    def counting(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(reporting, "_dumps_compact", counting)
+    rows = [{"types": ["a"], "found_by_queries": ["q"]} for _ in range(5)]
+    rows.append({"types": [1], "found_by_queries": ["q"]})
+    fieldnames = ["types", "found_by_queries"]
+    encoded = list(reporting._encode_csv_rows(rows, fieldnames, {"types": [], "found_by_queries": []}))
+
+    assert encoded[0] == ['["a"]', '["q"]']
+    assert encoded[-1] == ["[1]", '["q"]']
+    assert calls == [["a"], ["q"], [1]]
@@ -1,4 +1,8 @@
+from collections import Counter
 from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
 
 from src import config
 from src.cache import Cache, make_request_cache_key
@@ -23,10 +27,10 @@ class FakeResponse:
 class FakeSession:
     def __init__(self, responses_by_url):
         self.responses_by_url = responses_by_url
-        self.calls = []
+        self.calls: Counter[str] = Counter()
 
     def post(self, url, data=None, headers=None, timeout=None):
-        self.calls.append(url)
+        self.calls[url] += 1
         payload = self.responses_by_url.get(url, {})
         return FakeResponse(payload)
 
@@ -43,16 +47,33 @@ def make_http_client(responses_by_url):
     return client
 
 
-def test_dedup_integration_with_temp_cache(tmp_path):
-    metrics = RequestMetrics()
-    budget = RequestBudget(max_places=10, max_routes=10, metrics=metrics)
-    cache_path = tmp_path / "cache.db"
-    cache = Cache(str(cache_path))
-    responses = {
+# Empty Places page and a 120 s route; shared read-only by the metric tests.
+_DEFAULT_RESPONSES = MappingProxyType(
+    {
         config.PLACES_TEXT_SEARCH_URL: {"places": []},
         config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]},
     }
-    http_client = make_http_client(responses)
+)
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+@pytest.fixture
+def budget(metrics):
+    return RequestBudget(max_places=10, max_routes=10, metrics=metrics)
+
+
+@pytest.fixture
+def http_client():
+    return make_http_client(_DEFAULT_RESPONSES)
+
+
+def test_dedup_integration_with_temp_cache(tmp_path, metrics, budget, http_client):
+    cache_path = tmp_path / "cache.db"
+    cache = Cache(str(cache_path))
     places_client = PlacesClient(http_client, cache, budget, no_cache=False, metrics=metrics)
     routes_client = RoutesClient(
         http_client, cache, budget, no_cache=False, refresh_routes=True, metrics=metrics
@@ -71,20 +92,13 @@ def test_dedup_integration_with_temp_cache(tmp_path):
     assert metrics.network_routes == 1
     assert metrics.dedup_skips_places == 1
     assert metrics.dedup_skips_routes == 1
-    assert http_client.session.calls.count(config.PLACES_TEXT_SEARCH_URL) == 1
-    assert http_client.session.calls.count(config.ROUTES_COMPUTE_URL) == 1
+    assert http_client.session.calls[config.PLACES_TEXT_SEARCH_URL] == 1
+    assert http_client.session.calls[config.ROUTES_COMPUTE_URL] == 1
     cache.close()
 
 
-def test_network_counters_increment_with_mock_http():
-    metrics = RequestMetrics()
-    budget = RequestBudget(max_places=10, max_routes=10, metrics=metrics)
-    cache = Cache(":memory:")
-    responses = {
-        config.PLACES_TEXT_SEARCH_URL: {"places": []},
-        config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]},
-    }
-    http_client = make_http_client(responses)
+def test_network_counters_increment_with_mock_http(sqlite_cache, metrics, budget, http_client):
+    cache = sqlite_cache
     places_client = PlacesClient(http_client, cache, budget, no_cache=True, metrics=metrics)
     routes_client = RoutesClient(
         http_client, cache, budget, no_cache=True, refresh_routes=True, metrics=metrics
@@ -103,18 +117,10 @@ def test_network_counters_increment_with_mock_http():
     assert metrics.network_routes == 3
     assert metrics.cache_hits_places == 0
     assert metrics.cache_hits_routes == 0
-    cache.close()
 
 
-def test_cache_hits_increment_without_network():
-    metrics = RequestMetrics()
-    budget = RequestBudget(max_places=10, max_routes=10, metrics=metrics)
-    cache = Cache(":memory:")
-    responses = {
-        config.PLACES_TEXT_SEARCH_URL: {"places": []},
-        config.ROUTES_COMPUTE_URL: {"routes": [{"duration": "120s"}]},
-    }
-    http_client = make_http_client(responses)
+def test_cache_hits_increment_without_network(sqlite_cache, metrics, budget, http_client):
+    cache = sqlite_cache
     places_client = PlacesClient(http_client, cache, budget, no_cache=False, metrics=metrics)
     routes_client = RoutesClient(
         http_client, cache, budget, no_cache=False, refresh_routes=False, metrics=metrics
@@ -139,4 +145,94 @@ def test_cache_hits_increment_without_network():
     assert metrics.network_routes == 0
     assert metrics.cache_hits_places == 1
     assert metrics.cache_hits_routes == 1
+
+
+def test_text_search_key_memo_is_keyed_by_coordinates(sqlite_cache, budget, http_client):
+    cache = sqlite_cache
+    places_client = PlacesClient(http_client, cache, budget, no_cache=False)
+
+    point_a = {"id": "grid_1_1", "lat": 52.2, "lon": 21.0}
+    point_b = {"id": "grid_1_1", "lat": 52.3, "lon": 21.1}
+    body_a, key_a = places_client._text_search_request("ortodonta", point_a, None, None, None)
+    body_a2, key_a2 = places_client._text_search_request("ortodonta", point_a, None, None, None)
+    _, key_b = places_client._text_search_request("ortodonta", point_b, None, None, None)
+
+    expected = make_request_cache_key(
+        config.PLACES_TEXT_SEARCH_URL,
+        places_client.field_mask,
+        build_text_search_body("ortodonta", point_a, None, None),
+    )
+    assert key_a == expected
+    assert body_a2 is body_a and key_a2 == key_a
+    assert key_b != key_a
+
+
+def test_search_text_all_parses_each_cached_page_once(monkeypatch, sqlite_cache):
+    import src.places_client as places_module
+
+    cache = sqlite_cache
+    budget = RequestBudget(max_places=10, max_routes=10)
+    payload = {"places": [{"id": "p1", "displayName": {"text": "A"}}]}
+    http_client = make_http_client({config.PLACES_TEXT_SEARCH_URL: payload})
+    places_client = PlacesClient(http_client, cache, budget, no_cache=False)
+
+    parse_calls = []
+    original_parse = places_module.parse_places_response
+
+    def counting_parse(response):
+        parse_calls.append(response)
+        return original_parse(response)
+
+    monkeypatch.setattr(places_module, "parse_places_response", counting_parse)
+
+    point = {"lat": 52.2, "lon": 21.0}
+    first = places_client.search_text_all("ortodonta", point, max_pages=1)
+    second = places_client.search_text_all("ortodonta", point, max_pages=1)
+
+    assert [p["place_id"] for p in first] == ["p1"]
+    assert second == first
+    assert len(parse_calls) == 1
+    assert http_client.session.calls[config.PLACES_TEXT_SEARCH_URL] == 1
+
+
+def test_search_cache_writes_are_batched_until_commit(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    cache = Cache(cache_path, commit_every=3)
+    cache.set_search_cache("k1", {"places": [{"id": "p1"}]})
+    cache.set_search_cache("k2", {"places": []})
+
+    assert cache.get_search_cache("k1") == {"places": [{"id": "p1"}]}
+    row_count = cache.conn.execute("SELECT COUNT(*) FROM places_search_cache").fetchone()[0]
+    assert row_count == 0
+
+    cache.set_search_cache("k3", {"places": []})
+    row_count = cache.conn.execute("SELECT COUNT(*) FROM places_search_cache").fetchone()[0]
+    assert row_count == 3
+
+    cache.set_search_cache("k4", {"places": [{"id": "p4"}]})
     cache.close()
+
+    reopened = Cache(cache_path)
+    assert reopened.get_search_cache("k4") == {"places": [{"id": "p4"}]}
+    reopened.close()
+
+
+def test_routes_cache_writes_are_batched_until_commit(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    cache = Cache(cache_path, commit_every=3)
+    cache.set_routes_cache("r1", "hub", "p1", "TRANSIT", 600)
+    cache.set_routes_cache_many([("r2", "hub", "p2", "TRANSIT", None)])
+
+    assert cache.get_routes_cache("r1") == 600
+    row_count = cache.conn.execute("SELECT COUNT(*) FROM routes_cache").fetchone()[0]
+    assert row_count == 0
+
+    cache.set_routes_cache_many([("r3", "hub", "p3", "TRANSIT", 900), ("r4", "hub", "p4", "TRANSIT", 30)])
+    row_count = cache.conn.execute("SELECT COUNT(*) FROM routes_cache").fetchone()[0]
+    assert row_count == 3
+    cache.close()
+
+    reopened = Cache(cache_path)
+    assert reopened.get_routes_cache("r4") == 30
+    assert reopened.get_routes_cache("r2") is None
+    reopened.close()
@@ -1,7 +1,12 @@
 from datetime import datetime, timezone
 
 from src import config
-from src.routes_client import bucket_departure_key, build_routes_body
+from src.routes_client import (
+    _departure_bucket_from_rfc3339,
+    bucket_departure_key,
+    build_routes_body,
+    compute_departure_time_rfc3339,
+)
 
 
 def test_bucket_departure_key_same_bucket():
@@ -27,3 +32,23 @@ def test_build_routes_body_uses_exact_departure_time():
     departure = "2026-01-26T16:10:00Z"
     body = build_routes_body(origin, dest, departure, config.TRANSIT_MODE)
     assert body["departureTime"] == departure
+
+
+def test_departure_bucket_cache_tracks_timezone(monkeypatch):
+    departure = "2026-01-26T16:10:00Z"
+    minutes = config.ROUTES_CACHE_DEPARTURE_BUCKET_MINUTES
+    assert _departure_bucket_from_rfc3339(departure, minutes) == "wd0_1700"
+    assert _departure_bucket_from_rfc3339(departure, minutes) == "wd0_1700"
+
+    monkeypatch.setattr(config, "WARSAW_TIMEZONE", "UTC")
+    assert _departure_bucket_from_rfc3339(departure, minutes) == "wd0_1600"
+
+
+def test_departure_policy_skips_weekend_and_past_cutoff():
+    # Friday 2026-01-30 after 17:00 Warsaw -> Monday 2026-02-02 16:00Z.
+    friday_evening = datetime(2026, 1, 30, 17, 30, tzinfo=timezone.utc)
+    assert compute_departure_time_rfc3339(now_utc=friday_evening) == "2026-02-02T16:00:00Z"
+    saturday = datetime(2026, 1, 31, 9, 0, tzinfo=timezone.utc)
+    assert compute_departure_time_rfc3339(now_utc=saturday) == "2026-02-02T16:00:00Z"
+    tuesday_morning = datetime(2026, 1, 27, 8, 0, tzinfo=timezone.utc)
+    assert compute_departure_time_rfc3339(now_utc=tuesday_morning) == "2026-01-27T16:00:00Z"
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from src import config
+from src.cache import Cache
+from src.http import BudgetExceededError, HttpClient, RequestBudget, RequestMetrics
+from src.routes_client import RoutesClient, parse_route_matrix_durations
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+        self.status_code = 200
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+class FakeMatrixSession:
+    def __init__(self):
+        self.calls = []
+        self.bodies = []
+        self.field_masks = []
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.calls.append(url)
+        body = json.loads(data)
+        self.bodies.append(body)
+        self.field_masks.append(headers["X-Goog-FieldMask"])
+        count = len(body["destinations"])
+        # Reverse order and omit the zero index, as the API is allowed to.
+        payload = []
+        for index in reversed(range(count)):
+            element = {"originIndex": 0, "duration": f"{(index + 1) * 60}s", "condition": "ROUTE_EXISTS"}
+            if index:
+                element["destinationIndex"] = index
+            payload.append(element)
+        return FakeResponse(payload)
+
+
+def make_routes_client(tmp_path, max_routes=10, field_mask=config.ROUTES_FIELD_MASK_MIN):
+    metrics = RequestMetrics()
+    budget = RequestBudget(max_places=0, max_routes=max_routes, metrics=metrics)
+    http_client = HttpClient(api_key="dummy", timeout=1, retry_max=1, backoff_base=0.0, backoff_max=0.0)
+    http_client.session = FakeMatrixSession()
+    cache = Cache(str(tmp_path / "cache.db"))
+    client = RoutesClient(http_client, cache, budget, field_mask=field_mask, metrics=metrics)
+    return client, http_client.session, metrics, cache
+
+
+def test_batch_uses_one_matrix_call_and_shares_cache_keys(tmp_path):
+    client, session, metrics, cache = make_routes_client(tmp_path)
+    hub = {"lat": 52.2, "lon": 21.0}
+    dests = [{"place_id": f"p{i}", "lat": 52.2, "lon": 21.0 + i / 100} for i in range(3)]
+    departure = "2026-01-26T16:00:00Z"
+
+    durations = client.compute_route_durations_batch("hub", hub, dests, departure)
+
+    assert durations == {"p0": 60, "p1": 120, "p2": 180}
+    assert session.calls == [config.ROUTES_MATRIX_URL]
+    assert metrics.network_routes == 3
+    assert client.compute_route_duration("hub", hub, dests[1], departure) == 120
+    assert metrics.dedup_skips_routes == 1
+    cache.close()
+
+
+def test_batch_stores_granted_elements_before_budget_error(tmp_path):
+    client, session, metrics, cache = make_routes_client(tmp_path, max_routes=2)
+    hub = {"lat": 52.2, "lon": 21.0}
+    dests = [{"place_id": f"p{i}", "lat": 52.2, "lon": 21.0} for i in range(3)]
+    departure = "2026-01-26T16:00:00Z"
+
+    with pytest.raises(BudgetExceededError):
+        client.compute_route_durations_batch("hub", hub, dests, departure)
+
+    assert len(session.calls) == 1
+    assert metrics.network_routes == 2
+    assert client.compute_route_duration("hub", hub, dests[1], departure) == 120
+    cache.close()
+
+
+def test_batch_honours_routes_body_extra_and_field_mask(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "ROUTES_BODY_EXTRA", {"transitPreferences": {"allowedTravelModes": ["RAIL"]}})
+    monkeypatch.setattr(config, "ROUTES_MATRIX_BODY_EXTRA", {"languageCode": "pl"})
+    client, session, _, cache = make_routes_client(tmp_path, field_mask=config.ROUTES_FIELD_MASK_DEBUG)
+    hub = {"lat": 52.2, "lon": 21.0}
+    dests = [{"place_id": "p0", "lat": 52.2, "lon": 21.0}]
+
+    client.compute_route_durations_batch("hub", hub, dests, "2026-01-26T16:00:00Z")
+
+    assert session.bodies[0]["transitPreferences"] == {"allowedTravelModes": ["RAIL"]}
+    assert session.bodies[0]["languageCode"] == "pl"
+    assert session.field_masks == [config.ROUTES_MATRIX_FIELD_MASK_MIN + ",distanceMeters"]
+    cache.close()
+
+
+def test_parse_route_matrix_durations_skips_missing_routes():
+    response = [
+        {"destinationIndex": 1, "duration": "90s", "condition": "ROUTE_EXISTS"},
+        {"duration": "30s"},
+        {"destinationIndex": 2, "condition": "ROUTE_NOT_FOUND"},
+    ]
+    assert parse_route_matrix_durations(response, 3) == [30, 90, None]
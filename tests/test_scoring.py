@@ -1,4 +1,4 @@
-from src.scoring import quality_score
+from src.scoring import quality_score, quality_score_batch
 
 
 def test_quality_increases_with_rating():
@@ -23,3 +23,12 @@ def test_quality_prefers_large_sample_over_perfect_small():
     s1 = quality_score(4.7, 2000, c, m)["quality"]
     s2 = quality_score(5.0, 50, c, m)["quality"]
     assert s1 > s2
+
+
+def test_quality_score_batch_matches_scalar():
+    c = 4.2
+    m = 200
+    ratings = [4.0, 4.7, 5.0, 3.1]
+    vs = [200, 2000, 50, 0]
+    expected = [quality_score(r, v, c, m) for r, v in zip(ratings, vs)]
+    assert quality_score_batch(ratings, vs, c, m) == expected